@@ -1,76 +1,43 @@
-"""The Pregnancy Tracker integration."""
-from __future__ import annotations
-
-import logging
-import os
-import shutil
-from pathlib import Path
-from datetime import date
-
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-
-from .const import DOMAIN
-
-_LOGGER = logging.getLogger(__name__)
-
-PLATFORMS: list[Platform] = [Platform.SENSOR]
-
-
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Pregnancy Tracker from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
-
-    # Copy bundled images to www directory for web access
-    await hass.async_add_executor_job(_setup_images, hass)
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-    return True
-
-
-def _setup_images(hass: HomeAssistant) -> None:
-    """Copy bundled images to www directory."""
-    # Source: integration's images directory
-    integration_path = Path(__file__).parent
-    source_images = integration_path / "images"
-    
-    # Destination: /config/www/pregnancy_tracker/
-    www_path = Path(hass.config.path("www"))
-    dest_images = www_path / "pregnancy_tracker"
-    
-    # Only copy if source exists
-    if not source_images.exists():
-        _LOGGER.warning("Bundled images not found at %s", source_images)
-        return
-    
-    _LOGGER.debug("Bundled images found at %s", source_images)
-    
-    try:
-        # Create www directory if it doesn't exist
-        www_path.mkdir(exist_ok=True)
-        
-        # Copy images if not already present
-        if not dest_images.exists():
-            _LOGGER.info("Copying pregnancy tracker images to %s", dest_images)
-            shutil.copytree(source_images, dest_images)
-            _LOGGER.info("Successfully copied pregnancy tracker images")
-        else:
-            _LOGGER.debug("Pregnancy tracker images already exist at %s", dest_images)
-    except Exception as e:
-        _LOGGER.error(
-            "Failed to copy pregnancy tracker images from %s to %s: %s",
-            source_images,
-            dest_images,
-            e,
-        )
-
-
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-    return unload_ok
+"""The Pregnancy Tracker integration.
+
+The integration itself lives in integration.py. Its entry points are
+imported here when Home Assistant is running, and resolved on first access
+otherwise, so they are there however the package was first imported. The
+calculations, the timeline export (python -m custom_components.pregnancy_tracker)
+and the verse library tool (python -m custom_components.pregnancy_tracker.verse_store)
+then work without Home Assistant or any of its dependencies installed.
+"""
+import sys
+from typing import Any
+
+# Entry points Home Assistant looks up on the package
+_ENTRY_POINTS = (
+    "CONFIG_SCHEMA",
+    "async_remove_entry",
+    "async_setup",
+    "async_setup_entry",
+    "async_unload_entry",
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the entry points from integration.py on first access."""
+    if name not in _ENTRY_POINTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import integration
+
+    value = getattr(integration, name)
+    globals()[name] = value
+    return value
+
+
+if "homeassistant.core" in sys.modules:
+    # Home Assistant imports the package in its executor; import the
+    # integration there too rather than on first access in the event loop
+    from .integration import (  # noqa: F401
+        CONFIG_SCHEMA,
+        async_remove_entry,
+        async_setup,
+        async_setup_entry,
+        async_unload_entry,
+    )
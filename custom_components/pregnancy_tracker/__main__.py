@@ -0,0 +1,235 @@
+"""Export pregnancy timelines without running Home Assistant.
+
+Streams one row per day with the same values the sensors show::
+
+    python -m custom_components.pregnancy_tracker 2027-03-01 --format ndjson
+
+Rows are written as they are calculated, so long ranges and many due
+dates are exported in constant memory.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections.abc import Iterator
+from contextlib import ExitStack, closing
+from datetime import date, timedelta
+from typing import Any
+
+from .calculations import (
+    DUE_DATE_WINDOW_DAYS,
+    calculate_values,
+    get_countdown,
+    get_milestone,
+    get_milestone_progress,
+)
+from .comparisons import (
+    DEFAULT_VERSE_TABLE,
+    VerseFileError,
+    VerseTable,
+    get_all_comparisons,
+    get_weekly_summary,
+    load_bible_verses,
+)
+from .const import DEFAULT_PREGNANCY_LENGTH, MAX_PREGNANCY_LENGTH
+from .growth import get_growth
+from .verse_store import (
+    MAX_CONTENT_DAY,
+    VerseStore,
+    is_verse_library,
+    load_library_verses,
+    open_verse_store,
+)
+
+FORMAT_CSV = "csv"
+FORMAT_NDJSON = "ndjson"
+
+TIMELINE_FIELDS = (
+    "due_date",
+    "date",
+    "days_elapsed",
+    "days_remaining",
+    "weeks_elapsed",
+    "week_description",
+    "percent",
+    "trimester",
+    "status",
+    "countdown",
+    "milestone",
+    "next_milestone",
+    "veggie",
+    "dad",
+    "summary",
+    "tip",
+    "verse",
+    "verse_reference",
+    "estimated_length_cm",
+    "estimated_weight_g",
+)
+
+
+def iter_timeline(
+    due_date: date,
+    pregnancy_length: int,
+    first: date,
+    last: date,
+    verses: VerseTable = DEFAULT_VERSE_TABLE,
+    daily: tuple[VerseStore, str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield the timeline row of each day from first through last.
+
+    daily is an open verse library and translation to read per-day content
+    from, one day at a time.
+    """
+    start_date = due_date - timedelta(days=pregnancy_length)
+    day = first
+    while day <= last:
+        values = calculate_values(start_date, due_date, pregnancy_length, day)
+        week = values["weeks_elapsed"]
+        comparisons = get_all_comparisons(week)
+        growth = get_growth(values["days_elapsed"])
+        content = None
+        if daily is not None:
+            store, translation = daily
+            content = store.daily(
+                translation, max(0, min(MAX_CONTENT_DAY, values["days_elapsed"]))
+            )
+        verse = content.verse if content is not None and content.verse else verses.get(week)
+
+        yield {
+            "due_date": due_date.isoformat(),
+            "date": day.isoformat(),
+            "days_elapsed": values["days_elapsed"],
+            "days_remaining": values["days_remaining"],
+            "weeks_elapsed": week,
+            "week_description": f"{week}+{values['days_elapsed'] % 7}",
+            "percent": values["percent"],
+            "trimester": values["trimester"],
+            "status": values["status"],
+            "countdown": get_countdown(values["days_remaining"]),
+            "milestone": get_milestone(week),
+            "next_milestone": get_milestone_progress(week)["next_milestone"],
+            "veggie": comparisons["veggie"]["label"],
+            "dad": comparisons["dad"]["label"],
+            "summary": (
+                content.summary
+                if content is not None and content.summary
+                else get_weekly_summary(week)
+            ),
+            "tip": content.tip if content is not None and content.tip else None,
+            "verse": verse.text,
+            "verse_reference": verse.reference,
+            "estimated_length_cm": growth.length_cm,
+            "estimated_weight_g": growth.weight_g,
+        }
+        day += timedelta(days=1)
+
+
+def _parse_date(value: str) -> date:
+    """Parse a YYYY-MM-DD argument."""
+    try:
+        return date.fromisoformat(value)
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', use YYYY-MM-DD") from err
+
+
+def _parse_length(value: str) -> int:
+    """Parse a pregnancy length argument, in days."""
+    try:
+        length = int(value)
+    except ValueError:
+        length = 0
+    if not 1 <= length <= MAX_PREGNANCY_LENGTH:
+        raise argparse.ArgumentTypeError(
+            f"invalid length '{value}', use a number of days from 1 to {MAX_PREGNANCY_LENGTH}"
+        )
+    return length
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Write the timeline of one or more due dates to stdout."""
+    parser = argparse.ArgumentParser(
+        prog="python -m custom_components.pregnancy_tracker",
+        description="Export a day-by-day pregnancy timeline as CSV or NDJSON.",
+    )
+    parser.add_argument(
+        "due_dates", nargs="+", type=_parse_date, metavar="due_date", help="due date (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        "--length",
+        type=_parse_length,
+        default=DEFAULT_PREGNANCY_LENGTH,
+        help=f"pregnancy length in days (default: {DEFAULT_PREGNANCY_LENGTH})",
+    )
+    parser.add_argument(
+        "--from",
+        dest="first",
+        type=_parse_date,
+        help="first day to export (default: start of the pregnancy)",
+    )
+    parser.add_argument(
+        "--to",
+        dest="last",
+        type=_parse_date,
+        help=f"last day to export (default: {DUE_DATE_WINDOW_DAYS} days after the due date)",
+    )
+    parser.add_argument(
+        "--verses", default="", help="custom Bible verses JSON file or verse library (.db)"
+    )
+    parser.add_argument("--translation", default="", help="translation to read from a verse library")
+    parser.add_argument(
+        "--format", choices=(FORMAT_CSV, FORMAT_NDJSON), default=FORMAT_CSV, help="output format"
+    )
+    args = parser.parse_args(argv)
+
+    verses = DEFAULT_VERSE_TABLE
+    if args.verses:
+        if is_verse_library(args.verses):
+            verses = load_library_verses(args.verses, args.translation)
+        else:
+            verses = load_bible_verses(args.verses)
+        if verses.failure is not None:
+            sys.stderr.write(f"{verses.failure}\n")
+            return 1
+
+    if args.format == FORMAT_CSV:
+        writer = csv.DictWriter(sys.stdout, fieldnames=TIMELINE_FIELDS)
+        writer.writeheader()
+        write_row = writer.writerow
+    else:
+        def write_row(row: dict[str, Any]) -> None:
+            sys.stdout.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    with ExitStack() as stack:
+        daily = None
+        if args.verses and is_verse_library(args.verses):
+            try:
+                store = stack.enter_context(closing(open_verse_store(args.verses)))
+            except VerseFileError as err:
+                sys.stderr.write(f"{err}\n")
+                return 1
+            translation = store.resolve_translation(args.translation)
+            if store.has_daily(translation):
+                daily = (store, translation)
+
+        try:
+            for due_date in args.due_dates:
+                first = args.first or due_date - timedelta(days=args.length)
+                last = args.last or due_date + timedelta(days=DUE_DATE_WINDOW_DAYS)
+                for row in iter_timeline(due_date, args.length, first, last, verses, daily):
+                    write_row(row)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The reader went away, e.g. piped into head; Python would
+            # otherwise fail again flushing stdout at exit
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
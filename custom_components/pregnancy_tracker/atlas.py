@@ -0,0 +1,129 @@
+"""Sprite atlases of the comparison images for Pregnancy Tracker.
+
+An atlas packs every week's image of one mode into a single PNG, with a
+JSON map of where each week's tile is, so a gallery of all weeks loads in
+one request. Atlases are only built when Pillow is installed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional
+    Image = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Width and height of each week's tile in pixels
+ATLAS_TILE_SIZE = 200
+
+# Tiles per row; 7 columns fit 42 weeks in 6 rows
+ATLAS_COLUMNS = 7
+ATLAS_ROWS = -(-42 // ATLAS_COLUMNS)
+
+
+def atlas_key(mode: str, hashes: dict[int, str]) -> str:
+    """Return the content hash identifying the atlas of a set of images."""
+    digest = hashlib.sha256(f"{mode}:{ATLAS_TILE_SIZE}:{ATLAS_COLUMNS}".encode())
+    for week in sorted(hashes):
+        digest.update(f";{week}:{hashes[week]}".encode())
+    return digest.hexdigest()[:10]
+
+
+def tile_position(week: int) -> tuple[int, int]:
+    """Return the top left corner of a week's tile.
+
+    Every week has a fixed tile, so the layout does not shift when an image
+    is missing.
+    """
+    row, column = divmod(week - 1, ATLAS_COLUMNS)
+    return column * ATLAS_TILE_SIZE, row * ATLAS_TILE_SIZE
+
+
+def build_atlas(image_dir: Path, atlas_dir: Path, mode: str, hashes: dict[int, str]) -> str | None:
+    """Build the atlas of a mode's images unless it is already cached.
+
+    Atlases are stored as {mode}_{key}.png and {mode}_{key}.json in
+    atlas_dir. Older atlases of the mode are left in place until
+    remove_stale_atlases is called once the new URLs are in use. This reads
+    from and writes to disk and must be run in the executor.
+
+    Returns:
+        The atlas key, or None if no atlas could be built.
+    """
+    if Image is None or not hashes:
+        return None
+
+    key = atlas_key(mode, hashes)
+    image_path = atlas_dir / f"{mode}_{key}.png"
+    map_path = atlas_dir / f"{mode}_{key}.json"
+    if image_path.exists() and map_path.exists():
+        return key
+
+    weeks = sorted(hashes)
+    width = ATLAS_COLUMNS * ATLAS_TILE_SIZE
+    height = ATLAS_ROWS * ATLAS_TILE_SIZE
+    tiles: dict[str, dict[str, int]] = {}
+
+    try:
+        atlas = Image.new("RGBA", (width, height))
+        for week in weeks:
+            with Image.open(image_dir / mode / f"week_{week}.png") as image:
+                tile = image.convert("RGBA")
+            tile.thumbnail((ATLAS_TILE_SIZE, ATLAS_TILE_SIZE))
+            x, y = tile_position(week)
+            # Center images that are not square
+            atlas.paste(
+                tile,
+                (x + (ATLAS_TILE_SIZE - tile.width) // 2, y + (ATLAS_TILE_SIZE - tile.height) // 2),
+            )
+            tiles[str(week)] = {"x": x, "y": y}
+
+        atlas_dir.mkdir(parents=True, exist_ok=True)
+        # Write to temporary files first so a half written atlas is never served
+        image_tmp_path = image_path.with_name(f"{image_path.name}.tmp")
+        map_tmp_path = map_path.with_name(f"{map_path.name}.tmp")
+        atlas.save(image_tmp_path, format="PNG", optimize=True)
+        os.replace(image_tmp_path, image_path)
+        map_tmp_path.write_text(
+            json.dumps(
+                {
+                    "mode": mode,
+                    "tile_size": ATLAS_TILE_SIZE,
+                    "columns": ATLAS_COLUMNS,
+                    "width": width,
+                    "height": height,
+                    "weeks": tiles,
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(map_tmp_path, map_path)
+    except (OSError, ValueError, Image.DecompressionBombError) as err:
+        # Unreadable, oversized or corrupt images only cost the atlas
+        _LOGGER.warning("Failed to build the %s image atlas: %s", mode, err)
+        return None
+
+    _LOGGER.debug("Built the %s image atlas with %d images", mode, len(weeks))
+    return key
+
+
+def remove_stale_atlases(atlas_dir: Path, atlases: dict[str, str]) -> None:
+    """Remove the files of older atlases of the modes that have a current one.
+
+    This writes to disk and must be run in the executor.
+    """
+    for mode, key in atlases.items():
+        current = {f"{mode}_{key}.png", f"{mode}_{key}.json"}
+        for path in atlas_dir.glob(f"{mode}_*"):
+            if path.name in current:
+                continue
+            try:
+                path.unlink()
+            except OSError as err:
+                _LOGGER.debug("Failed to remove stale atlas file %s: %s", path, err)
@@ -0,0 +1,255 @@
+"""Pregnancy progress calculations for pregnancy tracker."""
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any
+
+# Days either side of the due date that are still considered on time
+DUE_DATE_WINDOW_DAYS = 14
+
+# Before the due time the countdown is refreshed hourly in the final week
+# and every minute on the final day
+FINAL_WEEK = timedelta(days=7)
+FINAL_DAY = timedelta(days=1)
+
+# Largest week a custom milestone may be set for
+MAX_MILESTONE_WEEK = 45
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A named stage that starts at the beginning of a week.
+
+    value is what is reported while the rule is the latest one reached and
+    defaults to the name.
+    """
+
+    week: int
+    name: str
+    value: Any = None
+
+    @property
+    def state(self) -> Any:
+        """Return the value reported while this rule is current."""
+        return self.name if self.value is None else self.value
+
+
+@dataclass(frozen=True)
+class RuleProgress:
+    """The rules reached by a week and the next one to come."""
+
+    current: Rule | None
+    reached: tuple[Rule, ...]
+    next: Rule | None
+
+
+class RuleTable:
+    """Rules sorted by week and looked up with a binary search.
+
+    Rules of the same week keep the order they were given in, so rules
+    added with extend() come after the built-in ones of their week.
+    """
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        """Initialize the table."""
+        self.rules = tuple(sorted(rules, key=lambda rule: rule.week))
+        self._weeks = [rule.week for rule in self.rules]
+
+    def extend(self, rules: Iterable[Rule]) -> RuleTable:
+        """Return a new table with additional rules."""
+        return RuleTable((*self.rules, *rules))
+
+    def evaluate(self, week: int) -> RuleProgress:
+        """Return the current, reached and next rules of a week."""
+        index = bisect_right(self._weeks, week)
+        return RuleProgress(
+            current=self.rules[index - 1] if index else None,
+            reached=self.rules[:index],
+            next=self.rules[index] if index < len(self.rules) else None,
+        )
+
+    def state(self, week: int, default: Any = None) -> Any:
+        """Return the state of the latest rule reached by a week."""
+        index = bisect_right(self._weeks, week)
+        return self.rules[index - 1].state if index else default
+
+
+TRIMESTER_RULES = RuleTable(
+    [
+        Rule(13, "Second trimester", 2),
+        Rule(27, "Third trimester", 3),
+    ]
+)
+
+MILESTONE_RULES = RuleTable(
+    [
+        Rule(5, "Heartbeat detected"),
+        Rule(13, "Second trimester"),
+        Rule(24, "Viability"),
+        Rule(27, "Third trimester"),
+        Rule(37, "Full term"),
+        Rule(40, "Due date", "Due date reached!"),
+    ]
+)
+
+TERM_RULES = RuleTable(
+    [
+        Rule(37, "Early term"),
+        Rule(39, "Full term"),
+        Rule(41, "Late term"),
+        Rule(42, "Post term"),
+    ]
+)
+
+
+def parse_custom_milestones(text: str) -> list[Rule]:
+    """Parse custom milestones given as one "week: name" per line.
+
+    Raises ValueError if a line is not a week and a name.
+    """
+    rules = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        week, separator, name = line.partition(":")
+        name = name.strip()
+        if not separator or not name:
+            raise ValueError(f"Expected 'week: name', got '{line.strip()}'")
+        try:
+            week_number = int(week)
+        except ValueError:
+            raise ValueError(f"Invalid week in '{line.strip()}'") from None
+        if not 0 <= week_number <= MAX_MILESTONE_WEEK:
+            raise ValueError(f"Week must be between 0 and {MAX_MILESTONE_WEEK}: '{line.strip()}'")
+        rules.append(Rule(week_number, name))
+    return rules
+
+
+def calculate_values(
+    start_date: date, due_date: date, pregnancy_length: int, today: date
+) -> dict[str, Any]:
+    """Calculate all pregnancy values for a given day."""
+    # Days elapsed since start
+    days_elapsed = (today - start_date).days
+
+    # Days remaining until due date
+    days_remaining = (due_date - today).days
+
+    # Weeks elapsed (rounded down)
+    weeks_elapsed = days_elapsed // 7
+
+    # Percentage complete
+    percent = min(100, max(0, (days_elapsed / pregnancy_length) * 100))
+
+    # Trimester (1, 2, or 3)
+    trimester = TRIMESTER_RULES.state(weeks_elapsed, 1)
+
+    # Status
+    if days_remaining < 0:
+        status = "overdue"
+    elif days_remaining == 0:
+        status = "due_today"
+    elif weeks_elapsed < 1:
+        status = "just_started"
+    else:
+        status = "in_progress"
+
+    return {
+        "days_elapsed": days_elapsed,
+        "days_remaining": days_remaining,
+        "weeks_elapsed": weeks_elapsed,
+        "percent": round(percent, 1),
+        "trimester": trimester,
+        "status": status,
+    }
+
+
+def get_milestone(week: int, milestones: RuleTable = MILESTONE_RULES) -> str:
+    """Get the latest milestone reached in a week."""
+    return milestones.state(week, "Early pregnancy")
+
+
+def get_milestone_progress(
+    week: int, milestones: RuleTable = MILESTONE_RULES
+) -> dict[str, Any]:
+    """Get the milestones reached by a week and the next one to come."""
+    progress = milestones.evaluate(week)
+    next_rule = progress.next
+    return {
+        "milestones_reached": [f"{rule.name} (Week {rule.week})" for rule in progress.reached],
+        "next_milestone": next_rule.name if next_rule is not None else None,
+        "weeks_to_next_milestone": next_rule.week - week if next_rule is not None else None,
+    }
+
+
+def get_countdown(days_remaining: int) -> str:
+    """Format the countdown to the due date."""
+    weeks_remaining = days_remaining // 7
+    days_in_week = days_remaining % 7
+
+    if days_remaining < 0:
+        return f"Overdue by {abs(days_remaining)} days"
+    elif days_remaining == 0:
+        return "Due today!"
+    elif weeks_remaining == 0:
+        return f"{days_remaining} days"
+    else:
+        return f"{weeks_remaining}w {days_in_week}d"
+
+
+def get_precise_countdown(remaining: timedelta) -> str:
+    """Format the time left until the due time in days and hours, or hours and minutes."""
+    hours, minutes = divmod(int(remaining.total_seconds() // 60), 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f"{days}d {hours}h"
+    return f"{hours}h {minutes}m"
+
+
+def get_refresh_cadence(remaining: timedelta) -> timedelta | None:
+    """Get how often the countdown changes, or None if only the day matters."""
+    if remaining <= timedelta(0) or remaining > FINAL_WEEK:
+        return None
+    if remaining > FINAL_DAY:
+        return timedelta(hours=1)
+    return timedelta(minutes=1)
+
+
+def get_next_refresh(now: datetime, due_at: datetime, next_midnight: datetime) -> datetime:
+    """Get the next time any value changes.
+
+    Values change at midnight, when the countdown enters the final week or
+    day, and at each countdown tick. Ticks are counted back from the due
+    time, so the countdown changes exactly when its hours or minutes do.
+    """
+    boundaries = [next_midnight]
+    boundaries.extend(
+        boundary
+        for boundary in (due_at - FINAL_WEEK, due_at - FINAL_DAY, due_at)
+        if boundary > now
+    )
+    remaining = due_at - now
+    if (cadence := get_refresh_cadence(remaining)) is not None:
+        ticks = remaining // cadence
+        tick = due_at - ticks * cadence
+        boundaries.append(tick if tick > now else tick + cadence)
+    return min(boundaries)
+
+
+def get_due_date_window(due_date: date) -> tuple[date, date]:
+    """Get the earliest and latest expected delivery dates."""
+    window = timedelta(days=DUE_DATE_WINDOW_DAYS)
+    return due_date - window, due_date + window
+
+
+def get_week_start(start_date: date, week: int) -> date:
+    """Get the first day of a pregnancy week."""
+    return start_date + timedelta(weeks=week)
+
+
+def get_term_status(week: int) -> str:
+    """Get the term status of a birth in a week."""
+    return TERM_RULES.state(week, "Preterm")
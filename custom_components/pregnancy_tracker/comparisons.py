@@ -1,7 +1,10 @@
 """Size comparison data for pregnancy tracker."""
+from __future__ import annotations
+
 import json
 import logging
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
 _LOGGER = logging.getLogger(__name__)
@@ -110,45 +113,35 @@ WEEKLY_SUMMARIES = {
 }
 
 
+def _build_comparisons(week: int) -> dict[str, dict[str, str]]:
+    """Build the comparisons of all modes for a week."""
+    data = COMPARISONS.get(week, {})
+    return {
+        mode: {"label": data.get(mode, f"Week {week}"), "image": _image_path(mode, week)}
+        for mode in ("veggie", "dad")
+    }
+
+
+# Comparisons by week, built once and shared by every tracker in that week
+ALL_COMPARISONS = {week: _build_comparisons(week) for week in range(1, 43)}
+
+
 def get_comparison(week: int, mode: str = "veggie") -> dict[str, str]:
     """Get size comparison data for a given week.
 
-    Returns a dict with 'label' and 'image' keys (no emoji).
+    Returns a dict with 'label' and 'image' keys (no emoji). The dict is
+    shared and must not be modified.
     """
-    if week < 1 or week > 42:
-        week = max(1, min(42, week))
-
-    data = COMPARISONS.get(week, {})
-
-    if mode == "dad":
-        return {
-            "label": data.get("dad", f"Week {week}"),
-            "image": _image_path("dad", week),
-        }
-    else:  # Default to veggie
-        return {
-            "label": data.get("veggie", f"Week {week}"),
-            "image": _image_path("veggie", week),
-        }
+    comparisons = ALL_COMPARISONS[max(1, min(42, week))]
+    return comparisons["dad"] if mode == "dad" else comparisons["veggie"]
 
 
 def get_all_comparisons(week: int) -> dict[str, dict[str, str]]:
-    """Get all comparison modes for a given week with images."""
-    if week < 1 or week > 42:
-        week = max(1, min(42, week))
-
-    data = COMPARISONS.get(week, {})
+    """Get all comparison modes for a given week with images.
 
-    return {
-        "veggie": {
-            "label": data.get("veggie", f"Week {week}"),
-            "image": _image_path("veggie", week),
-        },
-        "dad": {
-            "label": data.get("dad", f"Week {week}"),
-            "image": _image_path("dad", week),
-        },
-    }
+    The dict is shared and must not be modified.
+    """
+    return ALL_COMPARISONS[max(1, min(42, week))]
 
 
 def get_weekly_summary(week: int) -> str:
@@ -206,41 +199,19 @@ BIBLE_VERSES = {
 }
 
 
-def get_bible_verse(week: int, custom_path: str | None = None) -> dict[str, str]:
+def get_bible_verse(week: int, verses: VerseTable | None = None) -> dict[str, str]:
     """Get Bible verse for a given week.
     
     Args:
         week: The pregnancy week (1-42)
-        custom_path: Optional path to custom Bible verses JSON file
+        verses: Optional verse table loaded with load_bible_verses()
     
     Returns a dict with 'text' and 'reference' keys.
     """
-    if week < 1 or week > 42:
-        week = max(1, min(42, week))
-    
-    # Try to load custom verses if path is provided
-    if custom_path:
-        custom_verses = _load_custom_bible_verses(custom_path)
-        if custom_verses and str(week) in custom_verses:
-            custom_data = custom_verses[str(week)]
-            # Support both full dict format and simple text format
-            if isinstance(custom_data, dict):
-                return {
-                    "text": custom_data.get("text", ""),
-                    "reference": custom_data.get("reference", ""),
-                }
-            elif isinstance(custom_data, str):
-                # If only text is provided, reference will be empty
-                return {
-                    "text": custom_data,
-                    "reference": "",
-                }
-    
-    # Fall back to default verses
-    verse_data = BIBLE_VERSES.get(week, {})
+    verse = (verses or DEFAULT_VERSE_TABLE).get(week)
     return {
-        "text": verse_data.get("text", ""),
-        "reference": verse_data.get("reference", ""),
+        "text": verse.text,
+        "reference": verse.reference,
     }
 
 
@@ -300,70 +271,281 @@ def parse_bible_reference(reference: str) -> dict[str, str]:
     }
 
 
-def _load_custom_bible_verses(file_path: str) -> dict:
-    """Load custom Bible verses from a JSON file.
-    
-    Args:
-        file_path: Path to the JSON file containing custom verses
-        
-    Returns:
-        Dictionary with week numbers as keys and verse data as values,
-        or empty dict if file cannot be loaded.
+def _parse_verse_range(verse: str) -> tuple[int, int] | None:
+    """Parse a verse part like "13" or "24-25" into a (start, end) tuple."""
+    start, _, end = verse.partition("-")
+    start = start.strip()
+    end = end.strip() or start
+    if not (start.isdigit() and end.isdigit()) or int(end) < int(start):
+        return None
+    return int(start), int(end)
+
+
+@dataclass(frozen=True)
+class BibleVerse:
+    """A Bible verse with its reference parsed into components."""
+
+    text: str
+    reference: str
+    book: str
+    chapter: str
+    verse: str
+    book_and_chapter: str
+    verse_range: tuple[int, int] | None
+
+
+def make_bible_verse(text: str, reference: str) -> BibleVerse:
+    """Build a BibleVerse, parsing the reference once."""
+    parts = parse_bible_reference(reference)
+    return BibleVerse(
+        text=text,
+        reference=reference,
+        book=parts["book"],
+        chapter=parts["chapter"],
+        verse=parts["verse"],
+        book_and_chapter=parts["book_and_chapter"],
+        verse_range=_parse_verse_range(parts["verse"]) if parts["verse"] else None,
+    )
+
+
+class VerseTable:
+    """Week-indexed Bible verses, parsed and validated when loaded.
+
+    Lookups are plain tuple reads so sensors never touch the disk or
+    re-parse references while polling.
+    """
+
+    def __init__(
+        self,
+        verses: dict[int, BibleVerse],
+        errors: list[str] | None = None,
+        custom: bool = False,
+        failure: VerseFileError | None = None,
+    ) -> None:
+        """Initialize the table from a week -> verse mapping.
+
+        failure is set when the custom file could not be used at all and
+        the table only holds the default verses.
+        """
+        empty = make_bible_verse("", "")
+        self._verses = tuple(verses.get(week, empty) for week in range(43))
+        self.errors = errors or []
+        self.custom = custom
+        self.failure = failure
+
+    def get(self, week: int) -> BibleVerse:
+        """Return the verse for a week, clamped to 1-42."""
+        return self._verses[max(1, min(42, week))]
+
+
+DEFAULT_VERSE_TABLE = VerseTable(
+    {
+        week: make_bible_verse(data["text"], data["reference"])
+        for week, data in BIBLE_VERSES.items()
+    }
+)
+
+
+def validate_bible_verses(data: dict) -> tuple[dict[int, BibleVerse], list[str]]:
+    """Validate custom verse data and parse every reference.
+
+    Returns the valid verses keyed by week and a list of human readable
+    problems for the entries that had to be skipped or look suspicious.
+    """
+    verses: dict[int, BibleVerse] = {}
+    errors: list[str] = []
+
+    for key, value in data.items():
+        try:
+            week = int(key)
+        except (TypeError, ValueError):
+            errors.append(f"Week key '{key}' is not a number")
+            continue
+        if week < 1 or week > 42:
+            errors.append(f"Week {week} is outside the supported range 1-42")
+            continue
+
+        # Support both full dict format and simple text format
+        if isinstance(value, dict):
+            text = value.get("text", "")
+            reference = value.get("reference", "")
+        elif isinstance(value, str):
+            # If only text is provided, reference will be empty
+            text = value
+            reference = ""
+        else:
+            errors.append(f"Week {week} must be a string or an object")
+            continue
+
+        if not isinstance(text, str) or not isinstance(reference, str):
+            errors.append(f"Week {week} has a non-text 'text' or 'reference'")
+            continue
+
+        verse = make_bible_verse(text, reference)
+        if reference and (not verse.chapter.isdigit() or (verse.verse and verse.verse_range is None)):
+            errors.append(f"Week {week} has an unrecognized reference '{reference}'")
+        verses[week] = verse
+
+    return verses, errors
+
+
+def load_bible_verses(custom_path: str | None = None) -> VerseTable:
+    """Load the verse table, overlaying custom verses on the defaults.
+
+    A file that cannot be used at all is not logged here; it is returned
+    as the table's failure so the caller can report it once.
+
+    This reads from disk and must be run in the executor.
     """
+    if not custom_path:
+        return DEFAULT_VERSE_TABLE
+
     try:
-        # Handle both absolute and relative paths
-        path = Path(file_path)
-        
-        # If path is relative, try to resolve it from common Home Assistant locations
-        if not path.is_absolute():
-            # Try current directory first (for testing)
-            if path.exists():
-                pass  # Use the path as is
-            # Try /config directory (standard Home Assistant config directory)
-            elif (Path("/config") / file_path).exists():
-                path = Path("/config") / file_path
-            else:
-                _LOGGER.warning(
-                    "Custom Bible verses file not found at relative path: %s", 
-                    file_path
-                )
-                return {}
-        
-        if not path.exists():
-            _LOGGER.warning(
-                "Custom Bible verses file not found: %s", 
-                path
-            )
-            return {}
-        
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            
-        # Validate the structure
-        if not isinstance(data, dict):
-            _LOGGER.error(
-                "Custom Bible verses file has invalid format. Expected a dictionary."
-            )
-            return {}
-        
-        _LOGGER.info(
-            "Successfully loaded %d custom Bible verses from %s", 
-            len(data), 
-            path
+        data = read_custom_bible_verses(custom_path)
+    except VerseFileError as err:
+        return VerseTable(
+            {week: DEFAULT_VERSE_TABLE.get(week) for week in BIBLE_VERSES},
+            custom=True,
+            failure=err,
         )
-        return data
-        
-    except json.JSONDecodeError as err:
-        _LOGGER.error(
-            "Failed to parse custom Bible verses JSON file %s: %s",
-            file_path,
-            err
+
+    custom_verses, errors = validate_bible_verses(data)
+    if errors:
+        _LOGGER.warning(
+            "Custom Bible verses file %s has %d problem(s): %s",
+            custom_path,
+            len(errors),
+            "; ".join(errors),
+        )
+
+    verses = {week: DEFAULT_VERSE_TABLE.get(week) for week in BIBLE_VERSES}
+    verses.update(custom_verses)
+    _LOGGER.debug("Loaded %d custom Bible verses from %s", len(custom_verses), custom_path)
+    return VerseTable(verses, errors, custom=True)
+
+
+# Custom Bible verses files larger than this are rejected (1 MiB)
+MAX_CUSTOM_VERSES_FILE_SIZE = 1024 * 1024
+
+
+def resolve_custom_path(file_path: str) -> Path | None:
+    """Resolve a custom content file path, or None if it does not exist.
+
+    Relative paths are tried from the current directory first (for testing)
+    and then from the standard Home Assistant /config directory.
+    """
+    path = Path(file_path)
+    if not path.is_absolute() and not path.exists():
+        path = Path("/config") / file_path
+    return path if path.exists() else None
+
+
+class VerseFileError(Exception):
+    """Raised when a custom Bible verses file cannot be used."""
+
+    def __init__(self, reason: str, message: str) -> None:
+        """Initialize the error with a config flow error key."""
+        super().__init__(message)
+        self.reason = reason
+
+
+def read_json_object(file_path: str, label: str) -> dict:
+    """Read a JSON file holding one object and check its structure.
+
+    At most MAX_CUSTOM_VERSES_FILE_SIZE bytes are ever read, so an oversized
+    file is rejected without loading it into memory. label names the file's
+    content in error messages, e.g. "custom Bible verses".
+
+    Raises:
+        VerseFileError: The file is missing, too large, or not a JSON object.
+    """
+    title = label[0].upper() + label[1:]
+    path = resolve_custom_path(file_path)
+    if path is None:
+        raise VerseFileError("verses_not_found", f"{title} file not found: {file_path}")
+
+    try:
+        with open(path, "rb") as f:
+            raw = f.read(MAX_CUSTOM_VERSES_FILE_SIZE + 1)
+    except OSError as err:
+        raise VerseFileError(
+            "verses_unreadable", f"Failed to load {label} from {file_path}: {err}"
+        ) from err
+
+    if len(raw) > MAX_CUSTOM_VERSES_FILE_SIZE:
+        raise VerseFileError(
+            "verses_too_large",
+            f"{title} file {file_path} is larger than "
+            f"{MAX_CUSTOM_VERSES_FILE_SIZE // 1024} KiB",
         )
-        return {}
-    except Exception as err:
-        _LOGGER.error(
-            "Failed to load custom Bible verses from %s: %s",
-            file_path,
-            err
+
+    try:
+        data = json.loads(raw)
+    except ValueError as err:
+        raise VerseFileError(
+            "verses_invalid_json",
+            f"Failed to parse {label} JSON file {file_path}: {err}",
+        ) from err
+
+    # Validate the structure
+    if not isinstance(data, dict):
+        raise VerseFileError(
+            "verses_invalid_format",
+            f"{title} file has invalid format. Expected a dictionary.",
         )
-        return {}
+    return data
+
+
+def read_custom_bible_verses(file_path: str) -> dict:
+    """Read a custom Bible verses JSON file and check its structure.
+
+    Raises:
+        VerseFileError: The file is missing, too large, or not a JSON object.
+    """
+    return read_json_object(file_path, "custom Bible verses")
+
+
+def format_week_ranges(weeks: list[int]) -> str:
+    """Format sorted week numbers compactly, e.g. "1-3, 5, 10-11"."""
+    ranges: list[str] = []
+    start = prev = weeks[0]
+    for week in weeks[1:] + [0]:
+        if week == prev + 1:
+            prev = week
+            continue
+        ranges.append(str(start) if start == prev else f"{start}-{prev}")
+        start = prev = week
+    return ", ".join(ranges)
+
+
+def preview_bible_verses(file_path: str) -> dict[str, str]:
+    """Validate a custom Bible verses file and summarize it for a preview.
+
+    This reads from disk and must be run in the executor.
+
+    Returns:
+        Description placeholders with the verse count, the weeks covered,
+        a sample entry and the number of skipped or suspicious entries.
+
+    Raises:
+        VerseFileError: The file cannot be used at all.
+    """
+    verses, errors = validate_bible_verses(read_custom_bible_verses(file_path))
+    if not verses:
+        raise VerseFileError(
+            "verses_no_valid_entries",
+            f"Custom Bible verses file {file_path} has no valid verses",
+        )
+
+    weeks = sorted(verses)
+    sample = verses[weeks[0]]
+    sample_text = f"Week {weeks[0]}: {sample.text}"
+    if sample.reference:
+        sample_text += f" ({sample.reference})"
+
+    return {
+        "verse_count": str(len(verses)),
+        "weeks": format_week_ranges(weeks),
+        "sample": sample_text,
+        "problem_count": str(len(errors)),
+    }
@@ -19,11 +19,27 @@ from .const import (
     CONF_PREGNANCY_LENGTH,
     CONF_COMPARISON_MODE,
     CONF_CUSTOM_BIBLE_VERSES,
+    CONF_BIBLE_TRANSLATION,
+    CONF_NOTIFY_SERVICE,
+    CONF_NOTIFY_TIME,
+    CONF_NOTIFY_CADENCE,
+    CONF_CUSTOM_MILESTONES,
+    CONF_DUE_TIME,
+    CONF_ARCHIVE_AFTER_DAYS,
     DEFAULT_PREGNANCY_LENGTH,
+    MAX_PREGNANCY_LENGTH,
     DEFAULT_COMPARISON_MODE,
+    DEFAULT_NOTIFY_TIME,
+    DEFAULT_NOTIFY_CADENCE,
+    DEFAULT_ARCHIVE_AFTER_DAYS,
     COMPARISON_MODE_VEGGIE,
     COMPARISON_MODE_DAD,
+    NOTIFY_CADENCE_DAILY,
+    NOTIFY_CADENCE_WEEKLY,
 )
+from .calculations import parse_custom_milestones
+from .comparisons import VerseFileError
+from .verse_store import preview_verses
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,6 +49,11 @@ class PregnancyTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._data: dict[str, Any] = {}
+        self._verses_preview: dict[str, str] = {}
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -59,18 +80,32 @@ class PregnancyTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     await self.async_set_unique_id(f"pregnancy_{due_date_str}")
                     self._abort_if_unique_id_configured()
 
-                    return self.async_create_entry(
-                        title=f"Pregnancy Tracker ({due_date_str})",
-                        data={
-                            CONF_DUE_DATE: due_date_str,
-                            CONF_PREGNANCY_LENGTH: user_input.get(
-                                CONF_PREGNANCY_LENGTH, DEFAULT_PREGNANCY_LENGTH
-                            ),
-                            CONF_CUSTOM_BIBLE_VERSES: user_input.get(
-                                CONF_CUSTOM_BIBLE_VERSES, ""
-                            ),
-                        },
-                    )
+                    self._data = {
+                        CONF_DUE_DATE: due_date_str,
+                        CONF_PREGNANCY_LENGTH: user_input.get(
+                            CONF_PREGNANCY_LENGTH, DEFAULT_PREGNANCY_LENGTH
+                        ),
+                        CONF_CUSTOM_BIBLE_VERSES: user_input.get(
+                            CONF_CUSTOM_BIBLE_VERSES, ""
+                        ),
+                        CONF_BIBLE_TRANSLATION: user_input.get(
+                            CONF_BIBLE_TRANSLATION, ""
+                        ),
+                    }
+                    if not self._data[CONF_CUSTOM_BIBLE_VERSES]:
+                        return self._async_create_tracker()
+
+                    # Validate the verses file off the event loop
+                    try:
+                        self._verses_preview = await self.hass.async_add_executor_job(
+                            preview_verses,
+                            self._data[CONF_CUSTOM_BIBLE_VERSES],
+                            self._data[CONF_BIBLE_TRANSLATION],
+                        )
+                    except VerseFileError as err:
+                        errors[CONF_CUSTOM_BIBLE_VERSES] = err.reason
+                    else:
+                        return await self.async_step_verses_preview()
             except ValueError:
                 errors["due_date"] = "invalid_date"
 
@@ -81,7 +116,7 @@ class PregnancyTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_PREGNANCY_LENGTH, default=DEFAULT_PREGNANCY_LENGTH
                 ): selector.NumberSelector(
                     selector.NumberSelectorConfig(
-                        min=1, max=365, mode=selector.NumberSelectorMode.BOX
+                        min=1, max=MAX_PREGNANCY_LENGTH, mode=selector.NumberSelectorMode.BOX
                     )
                 ),
                 vol.Optional(CONF_CUSTOM_BIBLE_VERSES, default=""): selector.TextSelector(
@@ -89,6 +124,11 @@ class PregnancyTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         multiline=False,
                     )
                 ),
+                vol.Optional(CONF_BIBLE_TRANSLATION, default=""): selector.TextSelector(
+                    selector.TextSelectorConfig(
+                        multiline=False,
+                    )
+                ),
             }
         )
 
@@ -98,6 +138,61 @@ class PregnancyTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Import a tracker from configuration.yaml."""
+        due_date_str = import_data[CONF_DUE_DATE]
+        await self.async_set_unique_id(f"pregnancy_{due_date_str}")
+        self._abort_if_unique_id_configured()
+
+        self._data = {
+            CONF_DUE_DATE: due_date_str,
+            CONF_PREGNANCY_LENGTH: import_data[CONF_PREGNANCY_LENGTH],
+            CONF_CUSTOM_BIBLE_VERSES: import_data[CONF_CUSTOM_BIBLE_VERSES],
+            CONF_BIBLE_TRANSLATION: import_data[CONF_BIBLE_TRANSLATION],
+            CONF_COMPARISON_MODE: import_data[CONF_COMPARISON_MODE],
+            CONF_CUSTOM_MILESTONES: import_data[CONF_CUSTOM_MILESTONES],
+            CONF_ARCHIVE_AFTER_DAYS: import_data[CONF_ARCHIVE_AFTER_DAYS],
+            CONF_DUE_TIME: import_data[CONF_DUE_TIME],
+        }
+        if self._data[CONF_CUSTOM_BIBLE_VERSES]:
+            # Validate the verses file like the user step, off the event loop
+            try:
+                await self.hass.async_add_executor_job(
+                    preview_verses,
+                    self._data[CONF_CUSTOM_BIBLE_VERSES],
+                    self._data[CONF_BIBLE_TRANSLATION],
+                )
+            except VerseFileError as err:
+                _LOGGER.error(
+                    "Not importing the pregnancy tracker due %s from configuration.yaml: %s",
+                    due_date_str,
+                    err,
+                )
+                return self.async_abort(
+                    reason="invalid_custom_verses", description_placeholders={"error": str(err)}
+                )
+        return self._async_create_tracker()
+
+    async def async_step_verses_preview(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Show a summary of the custom verses file before saving."""
+        if user_input is not None:
+            return self._async_create_tracker()
+
+        return self.async_show_form(
+            step_id="verses_preview",
+            description_placeholders=self._verses_preview,
+        )
+
+    @callback
+    def _async_create_tracker(self) -> FlowResult:
+        """Create the config entry from the validated data."""
+        return self.async_create_entry(
+            title=f"Pregnancy Tracker ({self._data[CONF_DUE_DATE]})",
+            data=self._data,
+        )
+
 
 class PregnancyTrackerOptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for Pregnancy Tracker."""
@@ -105,6 +200,8 @@ class PregnancyTrackerOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self._config_entry = config_entry
+        self._data: dict[str, Any] = {}
+        self._verses_preview: dict[str, str] = {}
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -119,27 +216,55 @@ class PregnancyTrackerOptionsFlow(config_entries.OptionsFlow):
                 due_date = datetime.strptime(due_date_str, "%Y-%m-%d").date()
                 # Allow past dates in case user wants to track a completed pregnancy
                 # or correct a mistake
-                
-                # Update the config entry data
-                self.hass.config_entries.async_update_entry(
-                    self.config_entry,
-                    data={
-                        CONF_DUE_DATE: due_date_str,
-                        CONF_PREGNANCY_LENGTH: user_input.get(
-                            CONF_PREGNANCY_LENGTH, DEFAULT_PREGNANCY_LENGTH
-                        ),
-                        CONF_CUSTOM_BIBLE_VERSES: user_input.get(
-                            CONF_CUSTOM_BIBLE_VERSES, ""
-                        ),
-                    },
-                    title=f"Pregnancy Tracker ({due_date_str})",
-                )
-                
-                # Reload the integration to apply changes
-                await self.hass.config_entries.async_reload(self.config_entry.entry_id)
-                
-                return self.async_create_entry(title="", data={})
-                
+                self._data = {
+                    CONF_DUE_DATE: due_date_str,
+                    CONF_PREGNANCY_LENGTH: user_input.get(
+                        CONF_PREGNANCY_LENGTH, DEFAULT_PREGNANCY_LENGTH
+                    ),
+                    CONF_DUE_TIME: user_input.get(CONF_DUE_TIME, ""),
+                    CONF_CUSTOM_BIBLE_VERSES: user_input.get(
+                        CONF_CUSTOM_BIBLE_VERSES, ""
+                    ),
+                    CONF_BIBLE_TRANSLATION: user_input.get(
+                        CONF_BIBLE_TRANSLATION, ""
+                    ),
+                    CONF_NOTIFY_SERVICE: user_input.get(CONF_NOTIFY_SERVICE, ""),
+                    CONF_NOTIFY_TIME: user_input.get(CONF_NOTIFY_TIME, DEFAULT_NOTIFY_TIME),
+                    CONF_NOTIFY_CADENCE: user_input.get(
+                        CONF_NOTIFY_CADENCE, DEFAULT_NOTIFY_CADENCE
+                    ),
+                    CONF_CUSTOM_MILESTONES: user_input.get(CONF_CUSTOM_MILESTONES, ""),
+                    CONF_ARCHIVE_AFTER_DAYS: int(
+                        user_input.get(CONF_ARCHIVE_AFTER_DAYS, DEFAULT_ARCHIVE_AFTER_DAYS)
+                    ),
+                }
+                notify_service = self._data[CONF_NOTIFY_SERVICE]
+                if notify_service:
+                    domain, _, service = notify_service.rpartition(".")
+                    if not self.hass.services.has_service(domain or "notify", service):
+                        errors[CONF_NOTIFY_SERVICE] = "notify_service_not_found"
+
+                try:
+                    parse_custom_milestones(self._data[CONF_CUSTOM_MILESTONES])
+                except ValueError:
+                    errors[CONF_CUSTOM_MILESTONES] = "invalid_milestones"
+
+                if not errors and not self._data[CONF_CUSTOM_BIBLE_VERSES]:
+                    return await self._async_save()
+
+                if not errors:
+                    # Validate the verses file off the event loop
+                    try:
+                        self._verses_preview = await self.hass.async_add_executor_job(
+                            preview_verses,
+                            self._data[CONF_CUSTOM_BIBLE_VERSES],
+                            self._data[CONF_BIBLE_TRANSLATION],
+                        )
+                    except VerseFileError as err:
+                        errors[CONF_CUSTOM_BIBLE_VERSES] = err.reason
+                    else:
+                        return await self.async_step_verses_preview()
+
             except ValueError:
                 errors["due_date"] = "invalid_date"
 
@@ -148,9 +273,22 @@ class PregnancyTrackerOptionsFlow(config_entries.OptionsFlow):
         current_pregnancy_length = self.config_entry.data.get(
             CONF_PREGNANCY_LENGTH, DEFAULT_PREGNANCY_LENGTH
         )
+        current_due_time = self.config_entry.data.get(CONF_DUE_TIME, "")
         current_custom_bible_verses = self.config_entry.data.get(
             CONF_CUSTOM_BIBLE_VERSES, ""
         )
+        current_bible_translation = self.config_entry.data.get(
+            CONF_BIBLE_TRANSLATION, ""
+        )
+        current_notify_service = self.config_entry.data.get(CONF_NOTIFY_SERVICE, "")
+        current_notify_time = self.config_entry.data.get(CONF_NOTIFY_TIME, DEFAULT_NOTIFY_TIME)
+        current_notify_cadence = self.config_entry.data.get(
+            CONF_NOTIFY_CADENCE, DEFAULT_NOTIFY_CADENCE
+        )
+        current_custom_milestones = self.config_entry.data.get(CONF_CUSTOM_MILESTONES, "")
+        current_archive_after_days = self.config_entry.data.get(
+            CONF_ARCHIVE_AFTER_DAYS, DEFAULT_ARCHIVE_AFTER_DAYS
+        )
 
         data_schema = vol.Schema(
             {
@@ -159,9 +297,12 @@ class PregnancyTrackerOptionsFlow(config_entries.OptionsFlow):
                     CONF_PREGNANCY_LENGTH, default=current_pregnancy_length
                 ): selector.NumberSelector(
                     selector.NumberSelectorConfig(
-                        min=1, max=365, mode=selector.NumberSelectorMode.BOX
+                        min=1, max=MAX_PREGNANCY_LENGTH, mode=selector.NumberSelectorMode.BOX
                     )
                 ),
+                vol.Optional(
+                    CONF_DUE_TIME, description={"suggested_value": current_due_time or None}
+                ): selector.TimeSelector(),
                 vol.Optional(
                     CONF_CUSTOM_BIBLE_VERSES, default=current_custom_bible_verses
                 ): selector.TextSelector(
@@ -169,6 +310,45 @@ class PregnancyTrackerOptionsFlow(config_entries.OptionsFlow):
                         multiline=False,
                     )
                 ),
+                vol.Optional(
+                    CONF_BIBLE_TRANSLATION, default=current_bible_translation
+                ): selector.TextSelector(
+                    selector.TextSelectorConfig(
+                        multiline=False,
+                    )
+                ),
+                vol.Optional(
+                    CONF_NOTIFY_SERVICE, default=current_notify_service
+                ): selector.TextSelector(
+                    selector.TextSelectorConfig(
+                        multiline=False,
+                    )
+                ),
+                vol.Optional(
+                    CONF_NOTIFY_TIME, default=current_notify_time
+                ): selector.TimeSelector(),
+                vol.Optional(
+                    CONF_NOTIFY_CADENCE, default=current_notify_cadence
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=[NOTIFY_CADENCE_DAILY, NOTIFY_CADENCE_WEEKLY],
+                        translation_key=CONF_NOTIFY_CADENCE,
+                    )
+                ),
+                vol.Optional(
+                    CONF_CUSTOM_MILESTONES, default=current_custom_milestones
+                ): selector.TextSelector(
+                    selector.TextSelectorConfig(
+                        multiline=True,
+                    )
+                ),
+                vol.Optional(
+                    CONF_ARCHIVE_AFTER_DAYS, default=current_archive_after_days
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=365, mode=selector.NumberSelectorMode.BOX
+                    )
+                ),
             }
         )
 
@@ -180,3 +360,30 @@ class PregnancyTrackerOptionsFlow(config_entries.OptionsFlow):
                 "current_due_date": current_due_date,
             },
         )
+
+    async def async_step_verses_preview(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Show a summary of the custom verses file before saving."""
+        if user_input is not None:
+            return await self._async_save()
+
+        return self.async_show_form(
+            step_id="verses_preview",
+            description_placeholders=self._verses_preview,
+        )
+
+    async def _async_save(self) -> FlowResult:
+        """Save the validated data.
+
+        The entry's update listener applies the change to the running
+        entities in place, so no reload is needed.
+        """
+        # Update the config entry data
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data={**self.config_entry.data, **self._data},
+            title=f"Pregnancy Tracker ({self._data[CONF_DUE_DATE]})",
+        )
+
+        return self.async_create_entry(title="", data={})
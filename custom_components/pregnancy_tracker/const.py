@@ -2,16 +2,43 @@
 
 DOMAIN = "pregnancy_tracker"
 
+# hass.data[DOMAIN] key of the comparison images shared by all entries
+DATA_IMAGES = "images"
+
+# hass.data[DOMAIN] key of the verse tables shared by all entries
+DATA_VERSE_TABLES = "verse_tables"
+
 # Config keys
 CONF_DUE_DATE = "due_date"
 CONF_PREGNANCY_LENGTH = "pregnancy_length"
 CONF_COMPARISON_MODE = "comparison_mode"
 CONF_CUSTOM_COMPARISONS = "custom_comparisons"  # For advanced users (manual config only)
-CONF_CUSTOM_BIBLE_VERSES = "custom_bible_verses"  # Path to custom Bible verses JSON file
+CONF_CUSTOM_BIBLE_VERSES = "custom_bible_verses"  # Path to custom Bible verses JSON file or verse library
+CONF_BIBLE_TRANSLATION = "bible_translation"  # Translation to read from a verse library
+CONF_NOTIFY_SERVICE = "notify_service"  # Notify service for the digest, empty to disable
+CONF_NOTIFY_TIME = "notify_time"
+CONF_NOTIFY_CADENCE = "notify_cadence"
+CONF_CUSTOM_MILESTONES = "custom_milestones"  # Extra milestones, one "week: name" per line
+CONF_DUE_TIME = "due_time"  # Time of day on the due date the countdown runs to
+CONF_ARCHIVE_AFTER_DAYS = "archive_after_days"  # Days after the due date to archive, 0 to never
+CONF_ARCHIVED_ON = "archived_on"  # Day the values were frozen on, set while archived
 
 # Default values
 DEFAULT_PREGNANCY_LENGTH = 280
+MAX_PREGNANCY_LENGTH = 365
 DEFAULT_COMPARISON_MODE = "veggie"
+DEFAULT_NOTIFY_TIME = "08:00:00"
+DEFAULT_NOTIFY_CADENCE = "weekly"
+DEFAULT_ARCHIVE_AFTER_DAYS = 60
+
+# Services
+SERVICE_ARCHIVE = "archive"
+SERVICE_UNARCHIVE = "unarchive"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+# Digest cadences
+NOTIFY_CADENCE_DAILY = "daily"
+NOTIFY_CADENCE_WEEKLY = "weekly"
 
 # Comparison modes
 COMPARISON_MODE_VEGGIE = "veggie"
@@ -34,3 +61,10 @@ SENSOR_WEEKLY_SUMMARY = "weekly_summary"
 SENSOR_MILESTONE = "milestone"
 SENSOR_BIBLE_VERSE = "bible_verse"
 SENSOR_BIBLE_VERSE_REFERENCE = "bible_verse_reference"
+SENSOR_ESTIMATED_LENGTH = "estimated_length"
+SENSOR_ESTIMATED_WEIGHT = "estimated_weight"
+SENSOR_DUE_DATE = "due_date"
+SENSOR_EARLY_DUE_DATE = "early_due_date"
+SENSOR_LATE_DUE_DATE = "late_due_date"
+SENSOR_NEXT_MILESTONE = "next_milestone"
+SENSOR_NEXT_WEEK = "next_week"
@@ -0,0 +1,115 @@
+"""Estimated fetal growth for pregnancy tracker.
+
+Weekly reference values are interpolated into one estimate per day when
+this module is imported, so looking up a day is a plain tuple read.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# Growth is tabulated for days 0 through this day
+MAX_GROWTH_DAY = 300
+
+MEASUREMENT_CROWN_RUMP = "crown_rump"
+MEASUREMENT_CROWN_HEEL = "crown_heel"
+
+# Day from which length is measured crown to heel instead of crown to rump
+CROWN_HEEL_FROM_DAY = 20 * 7
+
+# Median crown-rump length in cm by week (weeks 6-20)
+CROWN_RUMP_LENGTH = {
+    6: 0.4, 7: 1.0, 8: 1.6, 9: 2.3, 10: 3.1, 11: 4.1, 12: 5.4, 13: 7.4,
+    14: 8.7, 15: 10.1, 16: 11.6, 17: 13.0, 18: 14.2, 19: 15.3, 20: 16.4,
+}
+
+# Median crown-heel length in cm by week (weeks 20-40)
+CROWN_HEEL_LENGTH = {
+    20: 25.6, 21: 26.7, 22: 27.8, 23: 28.9, 24: 30.0, 25: 34.6, 26: 35.6,
+    27: 36.6, 28: 37.6, 29: 38.6, 30: 39.9, 31: 41.1, 32: 42.4, 33: 43.7,
+    34: 45.0, 35: 46.2, 36: 47.4, 37: 48.6, 38: 49.8, 39: 50.7, 40: 51.2,
+}
+
+# Length percentiles assume a 5% coefficient of variation (z = 1.2816)
+LENGTH_P10_FACTOR = 1 - 1.2816 * 0.05
+LENGTH_P90_FACTOR = 1 + 1.2816 * 0.05
+
+# Estimated fetal weight in grams by week as (10th, 50th, 90th) percentile,
+# after Hadlock et al. (1991), which starts at week 10
+FETAL_WEIGHT = {
+    10: (26, 35, 44), 11: (34, 45, 56), 12: (43, 58, 73), 13: (55, 73, 91),
+    14: (70, 93, 116), 15: (88, 117, 146), 16: (110, 146, 183),
+    17: (136, 181, 226), 18: (167, 223, 279), 19: (205, 273, 341),
+    20: (248, 331, 414), 21: (299, 399, 499), 22: (359, 478, 598),
+    23: (426, 568, 710), 24: (503, 670, 838), 25: (589, 785, 981),
+    26: (685, 913, 1141), 27: (791, 1055, 1319), 28: (908, 1210, 1513),
+    29: (1034, 1379, 1724), 30: (1169, 1559, 1949), 31: (1313, 1751, 2189),
+    32: (1465, 1953, 2441), 33: (1622, 2162, 2702), 34: (1783, 2377, 2971),
+    35: (1946, 2595, 3244), 36: (2110, 2813, 3516), 37: (2271, 3028, 3785),
+    38: (2427, 3236, 4045), 39: (2576, 3435, 4294), 40: (2714, 3619, 4524),
+}
+
+
+# FETAL_WEIGHT split into one week-keyed series per percentile
+_WEIGHT_SERIES = [
+    {week: values[index] for week, values in FETAL_WEIGHT.items()} for index in range(3)
+]
+
+
+@dataclass(frozen=True)
+class GrowthEstimate:
+    """Estimated size for a day; values are None before they can be measured."""
+
+    length_cm: float | None
+    length_percentiles: tuple[float, float] | None
+    measurement: str | None
+    weight_g: int | None
+    weight_percentiles: tuple[int, int] | None
+
+
+def _interpolate(table: dict[int, float], day: int) -> float | None:
+    """Linearly interpolate a week-keyed table at a day.
+
+    Days before the first week are None, days after the last week are
+    clamped to the last value.
+    """
+    first, last = min(table), max(table)
+    week, offset = divmod(day, 7)
+    if week < first:
+        return None
+    if week >= last:
+        return table[last]
+    return table[week] + (table[week + 1] - table[week]) * offset / 7
+
+
+def _estimate(day: int) -> GrowthEstimate:
+    """Compute the growth estimate for a day from the weekly tables."""
+    if day >= CROWN_HEEL_FROM_DAY:
+        length = _interpolate(CROWN_HEEL_LENGTH, day)
+        measurement = MEASUREMENT_CROWN_HEEL
+    else:
+        length = _interpolate(CROWN_RUMP_LENGTH, day)
+        measurement = MEASUREMENT_CROWN_RUMP if length is not None else None
+
+    weights = [_interpolate(series, day) for series in _WEIGHT_SERIES]
+
+    return GrowthEstimate(
+        length_cm=round(length, 1) if length is not None else None,
+        length_percentiles=(
+            (round(length * LENGTH_P10_FACTOR, 1), round(length * LENGTH_P90_FACTOR, 1))
+            if length is not None
+            else None
+        ),
+        measurement=measurement,
+        weight_g=round(weights[1]) if weights[1] is not None else None,
+        weight_percentiles=(
+            (round(weights[0]), round(weights[2])) if weights[1] is not None else None
+        ),
+    )
+
+
+GROWTH_BY_DAY = tuple(_estimate(day) for day in range(MAX_GROWTH_DAY + 1))
+
+
+def get_growth(day: int) -> GrowthEstimate:
+    """Get the growth estimate for a number of days elapsed."""
+    return GROWTH_BY_DAY[max(0, min(MAX_GROWTH_DAY, day))]
@@ -0,0 +1,243 @@
+"""Comparison images served to the frontend for Pregnancy Tracker."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .atlas import build_atlas, remove_stale_atlases
+
+_LOGGER = logging.getLogger(__name__)
+
+IMAGE_MODES = ("veggie", "dad")
+
+# Image file names by week
+IMAGE_NAMES = {f"week_{week}.png": week for week in range(1, 43)}
+
+# Directory in the images directory holding the sprite atlases
+ATLAS_DIR = "atlas"
+ATLAS_NAME = re.compile(r"(veggie|dad)_[0-9a-f]{10}\.(png|json)")
+
+# URL the images are served from with long-lived cache headers
+IMAGES_URL = "/api/pregnancy_tracker/images"
+
+# Number of hex digits of the content hash added to image URLs
+HASH_LENGTH = 10
+
+# Image URLs change whenever the content does, so responses never go stale
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Sent for bare or outdated image URLs, whose content can still change
+NO_CACHE_CONTROL = "no-cache"
+
+# How often the images directory is checked for changes
+WATCH_INTERVAL = timedelta(minutes=1)
+
+ImageKey = tuple[str, int]
+
+
+def _scan_images(image_dir: Path) -> dict[ImageKey, tuple[int, int]]:
+    """Return the size and modification time of each comparison image.
+
+    This reads from disk and must be run in the executor.
+    """
+    stats: dict[ImageKey, tuple[int, int]] = {}
+    for mode in IMAGE_MODES:
+        try:
+            with os.scandir(image_dir / mode) as entries:
+                for entry in entries:
+                    if (week := IMAGE_NAMES.get(entry.name)) is None:
+                        continue
+                    stat = entry.stat()
+                    stats[(mode, week)] = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            continue
+    return stats
+
+
+def _hash_image(path: Path) -> str:
+    """Return a short hash of an image's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+class ComparisonImages:
+    """Know which comparison images the frontend can load, and their hashes.
+
+    The index covers the bundled images copied to www/pregnancy_tracker as
+    well as any user overrides placed there. It is built once at setup and
+    rebuilt only when an image is added, removed or changed, so sensors
+    never expose URLs that would 404. Only changed images are re-hashed.
+
+    When Pillow is available a sprite atlas of each mode is built as well;
+    atlases are cached on disk under the hash of the images they contain.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the image index."""
+        self.hass = hass
+        self.image_dir = Path(hass.config.path("www", "pregnancy_tracker"))
+        self._stats: dict[ImageKey, tuple[int, int]] = {}
+        self._hashes: dict[ImageKey, str] = {}
+        # Image URLs, built once per index so every tracker shares them
+        self._urls: dict[ImageKey, str] = {}
+        self._atlases: dict[str, str] = {}
+        self._listeners: list[Callable[[], None]] = []
+        self._unsub_watch: CALLBACK_TYPE | None = None
+
+    def url(self, mode: str, week: int) -> str | None:
+        """Return the URL of a comparison image, or None if it is missing.
+
+        The URL carries the image's content hash, so it changes whenever
+        the image does and can be cached by browsers indefinitely.
+        """
+        return self._urls.get((mode, max(1, min(42, week))))
+
+    def _set_index(
+        self,
+        index: tuple[dict[ImageKey, tuple[int, int]], dict[ImageKey, str], dict[str, str]],
+    ) -> None:
+        """Use a freshly built image index."""
+        self._stats, self._hashes, self._atlases = index
+        self._urls = {
+            (mode, week): f"{IMAGES_URL}/{mode}/week_{week}.png?v={content_hash}"
+            for (mode, week), content_hash in self._hashes.items()
+        }
+
+    def content_hash(self, mode: str, week: int) -> str | None:
+        """Return the content hash of a comparison image, or None if it is missing."""
+        return self._hashes.get((mode, week))
+
+    def atlas_url(self, mode: str, suffix: str = "png") -> str | None:
+        """Return the URL of a mode's sprite atlas (or its "json" map), if built."""
+        if (key := self._atlases.get(mode)) is None:
+            return None
+        return f"{IMAGES_URL}/{ATLAS_DIR}/{mode}_{key}.{suffix}"
+
+    def _build(
+        self, stats: dict[ImageKey, tuple[int, int]] | None = None
+    ) -> tuple[dict[ImageKey, tuple[int, int]], dict[ImageKey, str], dict[str, str]]:
+        """Scan the images, hash the ones that are new or changed and build the atlases."""
+        if stats is None:
+            stats = _scan_images(self.image_dir)
+        hashes: dict[ImageKey, str] = {}
+        for key, stat in stats.items():
+            if self._stats.get(key) == stat and key in self._hashes:
+                hashes[key] = self._hashes[key]
+                continue
+            mode, week = key
+            try:
+                hashes[key] = _hash_image(self.image_dir / mode / f"week_{week}.png")
+            except OSError as err:
+                _LOGGER.warning("Failed to read comparison image %s week %d: %s", mode, week, err)
+
+        atlases: dict[str, str] = {}
+        for mode in IMAGE_MODES:
+            mode_hashes = {week: value for (m, week), value in hashes.items() if m == mode}
+            if key := build_atlas(self.image_dir, self.image_dir / ATLAS_DIR, mode, mode_hashes):
+                atlases[mode] = key
+        return stats, hashes, atlases
+
+    async def async_load(self) -> None:
+        """Build the image index."""
+        self._set_index(await self.hass.async_add_executor_job(self._build))
+        await self._async_remove_stale_atlases()
+        _LOGGER.debug("Found %d comparison images in %s", len(self._hashes), self.image_dir)
+
+    async def _async_remove_stale_atlases(self) -> None:
+        """Remove the atlases replaced by the current index."""
+        await self.hass.async_add_executor_job(
+            remove_stale_atlases, self.image_dir / ATLAS_DIR, self._atlases
+        )
+
+    @callback
+    def async_start(self) -> None:
+        """Start watching the images directory, if not already watching."""
+        if self._unsub_watch is None:
+            self._unsub_watch = async_track_time_interval(
+                self.hass, self._async_check_dir, WATCH_INTERVAL
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop watching the images directory."""
+        if self._unsub_watch is not None:
+            self._unsub_watch()
+            self._unsub_watch = None
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for image index changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    async def _async_check_dir(self, now: datetime) -> None:
+        """Rebuild the image index if any image was added, removed or changed."""
+        stats = await self.hass.async_add_executor_job(_scan_images, self.image_dir)
+        if stats == self._stats:
+            return
+
+        _LOGGER.debug("Comparison images in %s changed, rebuilding the index", self.image_dir)
+        self._set_index(await self.hass.async_add_executor_job(self._build, stats))
+        for update_callback in list(self._listeners):
+            update_callback()
+        # Sensors now show the new atlas URLs, so the old atlases can go
+        await self._async_remove_stale_atlases()
+
+
+class ComparisonImageView(HomeAssistantView):
+    """Serve comparison images, with immutable cache headers when versioned.
+
+    The images are public under /local as well, so no authentication is
+    required. Only known image and atlas names are served. An image is
+    cached indefinitely only when its ?v= matches the current content hash;
+    bare or outdated URLs are revalidated, so a replaced image shows at
+    once. Atlas names carry their content hash, so they are immutable.
+    """
+
+    url = IMAGES_URL + "/{mode}/{filename}"
+    name = "api:pregnancy_tracker:images"
+    requires_auth = False
+
+    def __init__(
+        self, image_dir: Path, get_images: Callable[[], ComparisonImages | None]
+    ) -> None:
+        """Initialize the view."""
+        self._image_dir = image_dir
+        self._get_images = get_images
+
+    async def get(self, request: web.Request, mode: str, filename: str) -> web.StreamResponse:
+        """Return a comparison image."""
+        if mode == ATLAS_DIR:
+            if not ATLAS_NAME.fullmatch(filename):
+                raise web.HTTPNotFound
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        elif mode not in IMAGE_MODES or (week := IMAGE_NAMES.get(filename)) is None:
+            raise web.HTTPNotFound
+        else:
+            cache_control = NO_CACHE_CONTROL
+            version = request.query.get("v")
+            if version and (images := self._get_images()) is not None:
+                if version == images.content_hash(mode, week):
+                    cache_control = IMMUTABLE_CACHE_CONTROL
+        response = web.FileResponse(self._image_dir / mode / filename)
+        response.headers[hdrs.CACHE_CONTROL] = cache_control
+        return response
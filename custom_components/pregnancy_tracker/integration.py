@@ -0,0 +1,299 @@
+"""Setup, services and config entries of the Pregnancy Tracker integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import shutil
+from pathlib import Path
+from datetime import date
+
+import voluptuous as vol
+
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ConfigEntryNotReady, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    DOMAIN,
+    DATA_IMAGES,
+    DATA_VERSE_TABLES,
+    CONF_DUE_DATE,
+    CONF_PREGNANCY_LENGTH,
+    CONF_COMPARISON_MODE,
+    CONF_CUSTOM_BIBLE_VERSES,
+    CONF_BIBLE_TRANSLATION,
+    CONF_CUSTOM_MILESTONES,
+    CONF_DUE_TIME,
+    CONF_ARCHIVE_AFTER_DAYS,
+    CONF_ARCHIVED_ON,
+    DEFAULT_PREGNANCY_LENGTH,
+    MAX_PREGNANCY_LENGTH,
+    DEFAULT_COMPARISON_MODE,
+    DEFAULT_ARCHIVE_AFTER_DAYS,
+    COMPARISON_MODE_VEGGIE,
+    COMPARISON_MODE_DAD,
+    SERVICE_ARCHIVE,
+    SERVICE_UNARCHIVE,
+    ATTR_CONFIG_ENTRY_ID,
+)
+from .calculations import MAX_MILESTONE_WEEK
+from .images import ComparisonImages, ComparisonImageView
+from .snapshot import SnapshotView
+from .stats import async_clear_statistics
+from .templates import async_setup_template_functions
+from .tracker import PregnancyTracker
+from .verse_watcher import VerseTables
+
+_LOGGER = logging.getLogger(__name__)
+
+PLATFORMS: list[Platform] = [Platform.SENSOR]
+
+# Number of YAML trackers imported concurrently before yielding
+IMPORT_BATCH_SIZE = 25
+
+TRACKER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DUE_DATE): cv.date,
+        vol.Optional(CONF_PREGNANCY_LENGTH, default=DEFAULT_PREGNANCY_LENGTH): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PREGNANCY_LENGTH)
+        ),
+        vol.Optional(CONF_CUSTOM_BIBLE_VERSES, default=""): cv.string,
+        vol.Optional(CONF_BIBLE_TRANSLATION, default=""): cv.string,
+        vol.Optional(CONF_COMPARISON_MODE, default=DEFAULT_COMPARISON_MODE): vol.In(
+            [COMPARISON_MODE_VEGGIE, COMPARISON_MODE_DAD]
+        ),
+        vol.Optional(CONF_CUSTOM_MILESTONES, default={}): {
+            vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_MILESTONE_WEEK)): cv.string
+        },
+        vol.Optional(CONF_DUE_TIME): cv.time,
+        vol.Optional(CONF_ARCHIVE_AFTER_DAYS, default=DEFAULT_ARCHIVE_AFTER_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=365)
+        ),
+    }
+)
+
+SERVICE_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+CONFIG_SCHEMA = vol.Schema(
+    {DOMAIN: vol.All(cv.ensure_list, [TRACKER_SCHEMA])},
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the views and template functions and import YAML trackers."""
+    hass.http.register_view(
+        ComparisonImageView(
+            Path(hass.config.path("www", "pregnancy_tracker")), lambda: _prepared_images(hass)
+        )
+    )
+    hass.http.register_view(SnapshotView(hass))
+    async_setup_template_functions(hass)
+
+    async def async_handle_archive(call: ServiceCall) -> None:
+        """Archive a tracker."""
+        tracker = _get_tracker(hass, call)
+        if not tracker.archived:
+            tracker.async_archive()
+
+    async def async_handle_unarchive(call: ServiceCall) -> None:
+        """Bring an archived tracker back."""
+        tracker = _get_tracker(hass, call)
+        if tracker.archived:
+            tracker.async_unarchive()
+
+    hass.services.async_register(DOMAIN, SERVICE_ARCHIVE, async_handle_archive, SERVICE_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, SERVICE_UNARCHIVE, async_handle_unarchive, SERVICE_SCHEMA
+    )
+
+    if DOMAIN not in config:
+        return True
+
+    # Skip trackers that already exist or are listed twice before starting
+    # any flow, so re-importing a large list on every restart stays cheap
+    seen = {
+        entry.unique_id for entry in hass.config_entries.async_entries(DOMAIN)
+    }
+    trackers: list[dict] = []
+    for tracker in config[DOMAIN]:
+        due_date_str = tracker[CONF_DUE_DATE].isoformat()
+        unique_id = f"pregnancy_{due_date_str}"
+        if unique_id in seen:
+            continue
+        seen.add(unique_id)
+        milestones = "\n".join(
+            f"{week}: {name}" for week, name in sorted(tracker[CONF_CUSTOM_MILESTONES].items())
+        )
+        due_time = tracker.get(CONF_DUE_TIME)
+        trackers.append(
+            {
+                **tracker,
+                CONF_DUE_DATE: due_date_str,
+                CONF_DUE_TIME: due_time.isoformat() if due_time else "",
+                CONF_CUSTOM_MILESTONES: milestones,
+            }
+        )
+
+    if trackers:
+        _LOGGER.info("Importing %d pregnancy trackers from YAML", len(trackers))
+        hass.async_create_task(_async_import_trackers(hass, trackers))
+
+    return True
+
+
+def _get_tracker(hass: HomeAssistant, call: ServiceCall) -> PregnancyTracker:
+    """Return the loaded tracker a service call is for."""
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    tracker = hass.data.get(DOMAIN, {}).get(entry_id)
+    if not isinstance(tracker, PregnancyTracker):
+        raise ServiceValidationError(f"Pregnancy tracker {entry_id} is not loaded")
+    return tracker
+
+
+async def _async_import_trackers(hass: HomeAssistant, trackers: list[dict]) -> None:
+    """Create config entries for imported trackers in batches."""
+    for index in range(0, len(trackers), IMPORT_BATCH_SIZE):
+        await asyncio.gather(
+            *(
+                hass.config_entries.flow.async_init(
+                    DOMAIN, context={"source": SOURCE_IMPORT}, data=tracker
+                )
+                for tracker in trackers[index : index + IMPORT_BATCH_SIZE]
+            )
+        )
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up Pregnancy Tracker from a config entry."""
+    images = await _async_get_images(hass)
+
+    verse_tables = hass.data[DOMAIN].setdefault(DATA_VERSE_TABLES, VerseTables(hass))
+    tracker = PregnancyTracker(hass, entry, images, verse_tables)
+    await tracker.async_setup()
+    entry.async_on_unload(tracker.async_stop)
+    if not tracker.archived:
+        images.async_start()
+
+    hass.data[DOMAIN][entry.entry_id] = tracker
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    return True
+
+
+async def _async_get_images(hass: HomeAssistant) -> ComparisonImages:
+    """Return the comparison images, preparing them on first use.
+
+    The images are prepared once per run by a single task stored in
+    hass.data; entries set up while it runs await the same task, so the
+    copy and the index are never built twice or in parallel. A task that
+    failed is dropped, so the next setup attempt prepares them again.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (task := domain_data.get(DATA_IMAGES)) is None:
+        task = domain_data[DATA_IMAGES] = hass.async_create_task(
+            _async_prepare_images(hass), "pregnancy_tracker prepare images"
+        )
+    try:
+        # Shielded so one entry's cancelled setup does not cancel the others
+        return await asyncio.shield(task)
+    except Exception as err:
+        if domain_data.get(DATA_IMAGES) is task:
+            del domain_data[DATA_IMAGES]
+        raise ConfigEntryNotReady(f"Failed to prepare the comparison images: {err}") from err
+
+
+def _prepared_images(hass: HomeAssistant) -> ComparisonImages | None:
+    """Return the comparison images if they were prepared successfully."""
+    task = hass.data.get(DOMAIN, {}).get(DATA_IMAGES)
+    if task is None or not task.done() or task.cancelled() or task.exception() is not None:
+        return None
+    return task.result()
+
+
+async def _async_prepare_images(hass: HomeAssistant) -> ComparisonImages:
+    """Copy the bundled images and index them."""
+    # Copy bundled images to www directory for web access
+    await hass.async_add_executor_job(_setup_images, hass)
+    images = ComparisonImages(hass)
+    await images.async_load()
+    return images
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running tracker without a reload.
+
+    Archived trackers start nothing, so entering or leaving the archive, and
+    any change while archived, reloads the entry instead.
+    """
+    tracker: PregnancyTracker = hass.data[DOMAIN][entry.entry_id]
+    if tracker.archived or entry.data.get(CONF_ARCHIVED_ON):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    await tracker.async_update_config(entry)
+
+
+def _setup_images(hass: HomeAssistant) -> None:
+    """Copy bundled images to www directory."""
+    # Source: integration's images directory
+    integration_path = Path(__file__).parent
+    source_images = integration_path / "images"
+    
+    # Destination: /config/www/pregnancy_tracker/
+    www_path = Path(hass.config.path("www"))
+    dest_images = www_path / "pregnancy_tracker"
+    
+    # Only copy if source exists
+    if not source_images.exists():
+        _LOGGER.warning("Bundled images not found at %s", source_images)
+        return
+    
+    _LOGGER.debug("Bundled images found at %s", source_images)
+    
+    try:
+        # Create www directory if it doesn't exist
+        www_path.mkdir(exist_ok=True)
+        
+        # Copy images if not already present
+        if not dest_images.exists():
+            _LOGGER.info("Copying pregnancy tracker images to %s", dest_images)
+            shutil.copytree(source_images, dest_images)
+            _LOGGER.info("Successfully copied pregnancy tracker images")
+        else:
+            _LOGGER.debug("Pregnancy tracker images already exist at %s", dest_images)
+    except Exception as e:
+        _LOGGER.error(
+            "Failed to copy pregnancy tracker images from %s to %s: %s",
+            source_images,
+            dest_images,
+            e,
+        )
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry."""
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        hass.data[DOMAIN].pop(entry.entry_id)
+        # Stop watching the images once the last active tracker is gone;
+        # the prepared images are kept for entries set up again later
+        if (images := _prepared_images(hass)) is not None and not any(
+            isinstance(tracker, PregnancyTracker) and not tracker.archived
+            for tracker in hass.data[DOMAIN].values()
+        ):
+            images.async_stop()
+
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the Repairs issue and the statistics of a deleted entry."""
+    ir.async_delete_issue(hass, DOMAIN, f"custom_verses_{entry.entry_id}")
+    async_clear_statistics(hass, entry.entry_id)
@@ -0,0 +1,144 @@
+"""Scheduled digest notifications for Pregnancy Tracker."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
+
+from .calculations import get_milestone_progress
+from .comparisons import get_all_comparisons
+from .const import NOTIFY_CADENCE_WEEKLY
+
+if TYPE_CHECKING:
+    from .tracker import PregnancyTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def build_digest(tracker: PregnancyTracker, values: dict[str, Any]) -> dict[str, str]:
+    """Build the digest notification for the values of a day.
+
+    Everything is read from the tracker's shared state, so no sensor state
+    or template is involved.
+    """
+    week = values["weeks_elapsed"]
+    comparisons = get_all_comparisons(week)
+    verse = tracker.verses.verse(week)
+    progress = get_milestone_progress(week, tracker.milestones)
+
+    lines = [
+        f"Week {week}+{values['days_elapsed'] % 7} ({values['percent']}% complete, "
+        f"{values['days_remaining']} days to go)",
+        f"Size: {comparisons['veggie']['label']} ({comparisons['dad']['label']})",
+        tracker.verses.summary(week),
+        f"\"{verse.text}\" - {verse.reference}",
+    ]
+    if progress["next_milestone"] is not None:
+        lines.append(
+            f"Next milestone: {progress['next_milestone']} "
+            f"in {progress['weeks_to_next_milestone']} weeks"
+        )
+
+    return {
+        "title": f"{tracker.device_name}: Week {week}",
+        "message": "\n\n".join(lines),
+    }
+
+
+class DigestNotifier:
+    """Send a digest through a notify service at a set time of day.
+
+    The digest is built once per period (a day, or a week for the weekly
+    cadence) and sent at most once per period, even if the time of day is
+    changed in between.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, tracker: PregnancyTracker, service: str, time: str, cadence: str
+    ) -> None:
+        """Initialize the notifier."""
+        self.hass = hass
+        self._tracker = tracker
+        self.service = service
+        self.time = time
+        self.cadence = cadence
+        self._period: tuple[str, int] | None = None
+        self._digest: dict[str, str] = {}
+        self._sent_period: tuple[str, int] | None = None
+        self._unsub_time: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Schedule the digest if a notify service is configured."""
+        if not self.service:
+            return
+        send_time = dt_util.parse_time(self.time)
+        if send_time is None:
+            _LOGGER.error("Invalid digest notification time: %s", self.time)
+            return
+        self._unsub_time = async_track_time_change(
+            self.hass,
+            self._async_send,
+            hour=send_time.hour,
+            minute=send_time.minute,
+            second=send_time.second,
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop sending the digest."""
+        if self._unsub_time is not None:
+            self._unsub_time()
+            self._unsub_time = None
+
+    @callback
+    def async_reconfigure(self, service: str, time: str, cadence: str) -> None:
+        """Apply changed notification options."""
+        if (service, time, cadence) == (self.service, self.time, self.cadence):
+            return
+        self.async_stop()
+        self.service = service
+        self.time = time
+        self.cadence = cadence
+        self.async_start()
+
+    def _current_period(self, values: dict[str, Any]) -> tuple[str, int] | None:
+        """Return the period a digest is due for today, if any."""
+        days_elapsed = values["days_elapsed"]
+        if days_elapsed < 0:
+            return None
+        if self.cadence == NOTIFY_CADENCE_WEEKLY:
+            # Weekly digests go out on the first day of each week
+            if days_elapsed % 7:
+                return None
+            return (self.cadence, values["weeks_elapsed"])
+        return (self.cadence, days_elapsed)
+
+    async def _async_send(self, now: datetime) -> None:
+        """Send the digest for the current period."""
+        values = self._tracker.calculate_values()
+        period = self._current_period(values)
+        if period is None or period == self._sent_period:
+            return
+
+        if period != self._period:
+            await self._tracker.verses.async_ensure_day(values["days_elapsed"])
+            self._digest = build_digest(self._tracker, values)
+            self._period = period
+
+        domain, _, service = self.service.rpartition(".")
+        try:
+            await self.hass.services.async_call(
+                domain or "notify", service, dict(self._digest), blocking=True
+            )
+        except (HomeAssistantError, vol.Invalid) as err:
+            _LOGGER.error("Failed to send pregnancy digest via %s: %s", self.service, err)
+            return
+        self._sent_period = period
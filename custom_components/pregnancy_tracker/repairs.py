@@ -0,0 +1,87 @@
+"""Repairs for Pregnancy Tracker."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.repairs import ConfirmRepairFlow, RepairsFlow
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import selector
+
+from .comparisons import VerseFileError
+from .const import CONF_CUSTOM_BIBLE_VERSES, CONF_BIBLE_TRANSLATION
+from .verse_store import preview_verses
+
+
+class CustomVersesRepairFlow(RepairsFlow):
+    """Fix or clear an unusable custom Bible verses path."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Initialize the flow with the issue data."""
+        self._entry_id: str = data["entry_id"]
+        self._placeholders = {"path": data["path"], "error": data["error"]}
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Ask for a corrected path, or none to use the default verses."""
+        entry = self.hass.config_entries.async_get_entry(self._entry_id)
+        if entry is None:
+            return self.async_abort(reason="entry_removed")
+
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            data = {
+                CONF_CUSTOM_BIBLE_VERSES: user_input.get(CONF_CUSTOM_BIBLE_VERSES, ""),
+                CONF_BIBLE_TRANSLATION: entry.data.get(CONF_BIBLE_TRANSLATION, ""),
+            }
+            if data[CONF_CUSTOM_BIBLE_VERSES]:
+                # Validate the verses file off the event loop
+                try:
+                    await self.hass.async_add_executor_job(
+                        preview_verses,
+                        data[CONF_CUSTOM_BIBLE_VERSES],
+                        data[CONF_BIBLE_TRANSLATION],
+                    )
+                except VerseFileError as err:
+                    errors[CONF_CUSTOM_BIBLE_VERSES] = err.reason
+
+            if not errors:
+                # The entry's update listener reloads the verses in place
+                self.hass.config_entries.async_update_entry(
+                    entry, data={**entry.data, **data}
+                )
+                return self.async_create_entry(data={})
+
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_CUSTOM_BIBLE_VERSES,
+                    default=entry.data.get(CONF_CUSTOM_BIBLE_VERSES, ""),
+                ): selector.TextSelector(
+                    selector.TextSelectorConfig(
+                        multiline=False,
+                    )
+                ),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=data_schema,
+            errors=errors,
+            description_placeholders=self._placeholders,
+        )
+
+
+async def async_create_fix_flow(
+    hass: HomeAssistant,
+    issue_id: str,
+    data: dict[str, Any] | None,
+) -> RepairsFlow:
+    """Create a flow to fix an issue."""
+    if issue_id.startswith("custom_verses_") and data is not None:
+        return CustomVersesRepairFlow(data)
+    return ConfirmRepairFlow()
@@ -6,27 +6,27 @@ which has helped in code generation, improvements, and maintenance.
 from __future__ import annotations
 
 import logging
-from datetime import date, datetime, timedelta
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorEntity,
+    SensorEntityDescription,
     SensorDeviceClass,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfLength, UnitOfMass
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.typing import StateType
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
-    CONF_DUE_DATE,
-    CONF_PREGNANCY_LENGTH,
-    CONF_COMPARISON_MODE,
-    CONF_CUSTOM_BIBLE_VERSES,
-    DEFAULT_PREGNANCY_LENGTH,
-    DEFAULT_COMPARISON_MODE,
     SENSOR_WEEKS,
     SENSOR_DAYS_ELAPSED,
     SENSOR_DAYS_REMAINING,
@@ -42,11 +42,420 @@ from .const import (
     SENSOR_MILESTONE,
     SENSOR_BIBLE_VERSE,
     SENSOR_BIBLE_VERSE_REFERENCE,
+    SENSOR_ESTIMATED_LENGTH,
+    SENSOR_ESTIMATED_WEIGHT,
+    SENSOR_DUE_DATE,
+    SENSOR_EARLY_DUE_DATE,
+    SENSOR_LATE_DUE_DATE,
+    SENSOR_NEXT_MILESTONE,
+    SENSOR_NEXT_WEEK,
 )
-from .comparisons import get_comparison, get_all_comparisons, get_weekly_summary, get_bible_verse, parse_bible_reference
+from .calculations import (
+    get_countdown,
+    get_due_date_window,
+    get_milestone,
+    get_milestone_progress,
+    get_precise_countdown,
+    get_term_status,
+    get_week_start,
+)
+from .comparisons import get_comparison, get_all_comparisons
+from .growth import get_growth
+from .tracker import PregnancyTracker
 
 _LOGGER = logging.getLogger(__name__)
 
+TRIMESTER_NAMES = {
+    1: "First Trimester",
+    2: "Second Trimester",
+    3: "Third Trimester",
+}
+
+STATUS_NAMES = {
+    "overdue": "Overdue",
+    "due_today": "Due Today",
+    "just_started": "Just Started",
+    "in_progress": "In Progress",
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class PregnancyTrackerSensorEntityDescription(SensorEntityDescription):
+    """Describe a Pregnancy Tracker sensor.
+
+    The value and attribute functions receive the entry's tracker and the
+    values calculated for today, which are shared by all sensors of the entry.
+    """
+
+    value_fn: Callable[[PregnancyTracker, dict[str, Any]], StateType | date | datetime]
+    attr_fn: Callable[[PregnancyTracker, dict[str, Any]], dict[str, Any]] | None = None
+    # Sensors showing verses or daily content follow the verse source
+    uses_verses: bool = False
+    # Sensors showing image URLs follow the image index
+    uses_images: bool = False
+    # Sensors showing the time to the due time follow the countdown ticks
+    uses_time: bool = False
+
+
+def _weeks_attrs(tracker: PregnancyTracker, values: dict[str, Any]) -> dict[str, Any]:
+    """Return attributes for the weeks sensor."""
+    days_into_week = values["days_elapsed"] % 7
+    return {
+        "days_into_week": days_into_week,
+        "week_description": f"{values['weeks_elapsed']}+{days_into_week}",
+    }
+
+
+def _comparison_attrs(tracker: PregnancyTracker, values: dict[str, Any]) -> dict[str, Any]:
+    """Return labels and image URLs of both comparison modes."""
+    week = values["weeks_elapsed"]
+    comparisons = get_all_comparisons(week)
+    return {
+        "week": week,
+        "veggie": comparisons["veggie"]["label"],
+        "dad": comparisons["dad"]["label"],
+        "veggie_image": tracker.images.url("veggie", week),
+        "dad_image": tracker.images.url("dad", week),
+    }
+
+
+def _comparison_image_attrs(
+    tracker: PregnancyTracker, values: dict[str, Any]
+) -> dict[str, Any]:
+    """Return image URLs of both comparison modes and their sprite atlases."""
+    return {
+        **_comparison_attrs(tracker, values),
+        "veggie_atlas": tracker.images.atlas_url("veggie"),
+        "veggie_atlas_map": tracker.images.atlas_url("veggie", "json"),
+        "dad_atlas": tracker.images.atlas_url("dad"),
+        "dad_atlas_map": tracker.images.atlas_url("dad", "json"),
+    }
+
+
+def _countdown_value(tracker: PregnancyTracker, values: dict[str, Any]) -> str:
+    """Return the countdown, in hours or minutes close to a set due time."""
+    if (remaining := tracker.time_remaining()) is not None:
+        return get_precise_countdown(remaining)
+    return get_countdown(values["days_remaining"])
+
+
+def _countdown_attrs(tracker: PregnancyTracker, values: dict[str, Any]) -> dict[str, Any]:
+    """Return attributes for the countdown sensor."""
+    days_remaining = values["days_remaining"]
+    return {
+        "days_remaining": days_remaining,
+        "weeks_remaining": days_remaining // 7,
+        "days_in_week": days_remaining % 7,
+        "due_date": tracker.due_date.isoformat(),
+        "due_at": tracker.due_at.isoformat(),
+    }
+
+
+def _due_date_range_value(tracker: PregnancyTracker, values: dict[str, Any]) -> str:
+    """Return the two weeks either side of the due date."""
+    early_date, late_date = get_due_date_window(tracker.due_date)
+    return f"{early_date.strftime('%b %d')} - {late_date.strftime('%b %d')}"
+
+
+def _due_date_range_attrs(tracker: PregnancyTracker, values: dict[str, Any]) -> dict[str, Any]:
+    """Return attributes for the due date range sensor."""
+    early_date, late_date = get_due_date_window(tracker.due_date)
+    return {
+        "early_date": early_date.isoformat(),
+        "due_date": tracker.due_date.isoformat(),
+        "late_date": late_date.isoformat(),
+        "term_status": get_term_status(values["weeks_elapsed"]),
+    }
+
+
+def _next_milestone_value(
+    tracker: PregnancyTracker, values: dict[str, Any]
+) -> datetime | None:
+    """Return when the next milestone's week starts."""
+    next_rule = tracker.milestones.evaluate(values["weeks_elapsed"]).next
+    if tracker.archived or next_rule is None:
+        return None
+    return dt_util.start_of_local_day(get_week_start(tracker.start_date, next_rule.week))
+
+
+def _next_milestone_attrs(tracker: PregnancyTracker, values: dict[str, Any]) -> dict[str, Any]:
+    """Return the name and week of the next milestone."""
+    next_rule = tracker.milestones.evaluate(values["weeks_elapsed"]).next
+    return {
+        "milestone": next_rule.name if next_rule is not None else None,
+        "week": next_rule.week if next_rule is not None else None,
+    }
+
+
+def _next_week_value(tracker: PregnancyTracker, values: dict[str, Any]) -> datetime | None:
+    """Return when the next pregnancy week starts."""
+    if tracker.archived:
+        return None
+    return dt_util.start_of_local_day(
+        get_week_start(tracker.start_date, values["weeks_elapsed"] + 1)
+    )
+
+
+def _weekly_summary_attrs(tracker: PregnancyTracker, values: dict[str, Any]) -> dict[str, Any]:
+    """Return attributes for the weekly summary sensor."""
+    daily = tracker.verses.daily
+    return {
+        "week": values["weeks_elapsed"],
+        "day": values["days_elapsed"],
+        "tip": daily.tip if daily is not None and daily.tip else None,
+    }
+
+
+def _milestone_attrs(tracker: PregnancyTracker, values: dict[str, Any]) -> dict[str, Any]:
+    """Return the milestones reached and the next one."""
+    week = values["weeks_elapsed"]
+    progress = get_milestone_progress(week, tracker.milestones)
+    return {
+        "week": week,
+        "milestones_reached": progress["milestones_reached"],
+        "milestone_count": len(progress["milestones_reached"]),
+        "next_milestone": progress["next_milestone"],
+        "weeks_to_next_milestone": progress["weeks_to_next_milestone"],
+    }
+
+
+def _bible_verse_attrs(tracker: PregnancyTracker, values: dict[str, Any]) -> dict[str, Any]:
+    """Return attributes for the Bible verse sensor."""
+    week = values["weeks_elapsed"]
+    verse = tracker.verses.verse(week)
+    return {
+        "week": week,
+        "day": values["days_elapsed"],
+        "reference": verse.reference,
+        "text": verse.text,
+        "custom_verses_enabled": tracker.verses.table.custom,
+    }
+
+
+def _bible_verse_reference_attrs(
+    tracker: PregnancyTracker, values: dict[str, Any]
+) -> dict[str, Any]:
+    """Return attributes for the Bible verse reference sensor."""
+    week = values["weeks_elapsed"]
+    verse = tracker.verses.verse(week)
+    return {
+        "week": week,
+        "day": values["days_elapsed"],
+        "book": verse.book,
+        "chapter": verse.chapter,
+        "verse": verse.verse,
+        "full_reference": verse.reference,
+    }
+
+
+def _estimated_length_attrs(tracker: PregnancyTracker, values: dict[str, Any]) -> dict[str, Any]:
+    """Return the length percentiles for today."""
+    growth = get_growth(values["days_elapsed"])
+    percentiles = growth.length_percentiles or (None, None)
+    return {
+        "week": values["weeks_elapsed"],
+        "day": values["days_elapsed"],
+        "measurement": growth.measurement,
+        "percentile_10": percentiles[0],
+        "percentile_50": growth.length_cm,
+        "percentile_90": percentiles[1],
+    }
+
+
+def _estimated_weight_attrs(tracker: PregnancyTracker, values: dict[str, Any]) -> dict[str, Any]:
+    """Return the weight percentiles for today."""
+    growth = get_growth(values["days_elapsed"])
+    percentiles = growth.weight_percentiles or (None, None)
+    return {
+        "week": values["weeks_elapsed"],
+        "day": values["days_elapsed"],
+        "percentile_10": percentiles[0],
+        "percentile_50": growth.weight_g,
+        "percentile_90": percentiles[1],
+    }
+
+
+SENSOR_DESCRIPTIONS: tuple[PregnancyTrackerSensorEntityDescription, ...] = (
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_WEEKS,
+        name="Weeks",
+        icon="mdi:calendar-week",
+        native_unit_of_measurement="weeks",
+        value_fn=lambda tracker, values: values["weeks_elapsed"],
+        attr_fn=_weeks_attrs,
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_DAYS_ELAPSED,
+        name="Days Elapsed",
+        icon="mdi:calendar-check",
+        native_unit_of_measurement="days",
+        value_fn=lambda tracker, values: values["days_elapsed"],
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_DAYS_REMAINING,
+        name="Days Remaining",
+        icon="mdi:calendar-clock",
+        native_unit_of_measurement="days",
+        value_fn=lambda tracker, values: values["days_remaining"],
+        attr_fn=lambda tracker, values: {"due_date": tracker.due_date.isoformat()},
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_PERCENT,
+        name="Percent Complete",
+        icon="mdi:percent",
+        native_unit_of_measurement="%",
+        value_fn=lambda tracker, values: values["percent"],
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_TRIMESTER,
+        name="Trimester",
+        icon="mdi:numeric",
+        value_fn=lambda tracker, values: values["trimester"],
+        attr_fn=lambda tracker, values: {
+            "trimester_name": TRIMESTER_NAMES.get(values["trimester"], "Unknown"),
+        },
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_STATUS,
+        name="Status",
+        icon="mdi:information",
+        value_fn=lambda tracker, values: STATUS_NAMES.get(values["status"], "Unknown"),
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_SIZE_COMPARISON,
+        name="Size Comparison",
+        icon="mdi:ruler",
+        value_fn=lambda tracker, values: get_comparison(values["weeks_elapsed"], "veggie")["label"],
+        attr_fn=_comparison_attrs,
+        uses_images=True,
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_DAD_SIZE_COMPARISON,
+        name="Dad Size Comparison",
+        icon="mdi:ruler",
+        value_fn=lambda tracker, values: get_comparison(values["weeks_elapsed"], "dad")["label"],
+        attr_fn=_comparison_attrs,
+        uses_images=True,
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_SIZE_COMPARISON_IMAGE,
+        name="Size Comparison Image",
+        icon="mdi:image-outline",
+        value_fn=lambda tracker, values: tracker.images.url("veggie", values["weeks_elapsed"]),
+        attr_fn=_comparison_image_attrs,
+        uses_images=True,
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_COUNTDOWN,
+        name="Countdown",
+        icon="mdi:timer-outline",
+        value_fn=_countdown_value,
+        attr_fn=_countdown_attrs,
+        uses_time=True,
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_DUE_DATE_RANGE,
+        name="Due Date Range",
+        icon="mdi:calendar-range",
+        value_fn=_due_date_range_value,
+        attr_fn=_due_date_range_attrs,
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_WEEKLY_SUMMARY,
+        name="Weekly Summary",
+        icon="mdi:text-box-outline",
+        value_fn=lambda tracker, values: tracker.verses.summary(values["weeks_elapsed"]),
+        attr_fn=_weekly_summary_attrs,
+        uses_verses=True,
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_MILESTONE,
+        name="Milestone",
+        icon="mdi:trophy-outline",
+        value_fn=lambda tracker, values: get_milestone(
+            values["weeks_elapsed"], tracker.milestones
+        ),
+        attr_fn=_milestone_attrs,
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_BIBLE_VERSE,
+        name="Bible Verse",
+        icon="mdi:book-open-variant",
+        value_fn=lambda tracker, values: tracker.verses.verse(values["weeks_elapsed"]).text,
+        attr_fn=_bible_verse_attrs,
+        uses_verses=True,
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_BIBLE_VERSE_REFERENCE,
+        name="Bible Verse Reference",
+        icon="mdi:bookmark-outline",
+        value_fn=lambda tracker, values: (
+            tracker.verses.verse(values["weeks_elapsed"]).book_and_chapter
+        ),
+        attr_fn=_bible_verse_reference_attrs,
+        uses_verses=True,
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_ESTIMATED_LENGTH,
+        name="Estimated Length",
+        icon="mdi:human-male-height",
+        native_unit_of_measurement=UnitOfLength.CENTIMETERS,
+        device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda tracker, values: get_growth(values["days_elapsed"]).length_cm,
+        attr_fn=_estimated_length_attrs,
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_ESTIMATED_WEIGHT,
+        name="Estimated Weight",
+        icon="mdi:scale",
+        native_unit_of_measurement=UnitOfMass.GRAMS,
+        device_class=SensorDeviceClass.WEIGHT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda tracker, values: get_growth(values["days_elapsed"]).weight_g,
+        attr_fn=_estimated_weight_attrs,
+    ),
+    # Dates and times the frontend counts down to by itself
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_DUE_DATE,
+        name="Due Date",
+        icon="mdi:calendar-heart",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda tracker, values: tracker.due_at,
+        attr_fn=lambda tracker, values: {"due_date": tracker.due_date.isoformat()},
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_EARLY_DUE_DATE,
+        name="Early Due Date",
+        icon="mdi:calendar-start",
+        device_class=SensorDeviceClass.DATE,
+        value_fn=lambda tracker, values: get_due_date_window(tracker.due_date)[0],
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_LATE_DUE_DATE,
+        name="Late Due Date",
+        icon="mdi:calendar-end",
+        device_class=SensorDeviceClass.DATE,
+        value_fn=lambda tracker, values: get_due_date_window(tracker.due_date)[1],
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_NEXT_MILESTONE,
+        name="Next Milestone",
+        icon="mdi:flag-checkered",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=_next_milestone_value,
+        attr_fn=_next_milestone_attrs,
+    ),
+    PregnancyTrackerSensorEntityDescription(
+        key=SENSOR_NEXT_WEEK,
+        name="Next Week",
+        icon="mdi:calendar-arrow-right",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=_next_week_value,
+        attr_fn=lambda tracker, values: {"week": values["weeks_elapsed"] + 1},
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -54,734 +463,71 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Pregnancy Tracker sensors from a config entry."""
-    due_date_str = config_entry.data[CONF_DUE_DATE]
-    pregnancy_length = config_entry.data.get(CONF_PREGNANCY_LENGTH, DEFAULT_PREGNANCY_LENGTH)
-    custom_bible_verses = config_entry.data.get(CONF_CUSTOM_BIBLE_VERSES, "")
-
-    due_date = datetime.strptime(due_date_str, "%Y-%m-%d").date()
-    start_date = due_date - timedelta(days=pregnancy_length)
+    tracker: PregnancyTracker = hass.data[DOMAIN][config_entry.entry_id]
 
     # Create device info for grouping sensors
     # Note: sw_version must match the version in manifest.json
     # After updating the version, users should restart Home Assistant or reload the integration
     device_info = DeviceInfo(
         identifiers={(DOMAIN, config_entry.entry_id)},
-        name=f"Pregnancy Tracker {due_date_str}",
+        name=tracker.device_name,
         manufacturer="Higher Ground Studio",
         model="Pregnancy Tracker",
         sw_version="1.0.2",
     )
 
-    sensors = [
-        PregnancyWeeksSensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-        PregnancyDaysElapsedSensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-        PregnancyDaysRemainingSensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-        PregnancyPercentSensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-        PregnancyTrimesterSensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-        PregnancyStatusSensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-        PregnancySizeComparisonSensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-        PregnancyDadSizeComparisonSensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-        PregnancySizeComparisonImageSensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-        PregnancyCountdownSensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-        PregnancyDueDateRangeSensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-        PregnancyWeeklySummarySensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-        PregnancyMilestoneSensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-        PregnancyBibleVerseSensor(config_entry, due_date, start_date, pregnancy_length, device_info, custom_bible_verses),
-        PregnancyBibleVerseReferenceSensor(config_entry, due_date, start_date, pregnancy_length, device_info),
-    ]
-
-    async_add_entities(sensors)
-
-
-class PregnancyTrackerSensorBase(SensorEntity):
-    """Base class for Pregnancy Tracker sensors."""
-
-    _attr_has_entity_name = True
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        self._config_entry = config_entry
-        self._due_date = due_date
-        self._start_date = start_date
-        self._pregnancy_length = pregnancy_length
-        self._attr_device_info = device_info
-
-    def _calculate_values(self) -> dict[str, Any]:
-        """Calculate all pregnancy values."""
-        today = date.today()
-        
-        # Days elapsed since start
-        days_elapsed = (today - self._start_date).days
-        
-        # Days remaining until due date
-        days_remaining = (self._due_date - today).days
-        
-        # Weeks elapsed (rounded down)
-        weeks_elapsed = days_elapsed // 7
-        
-        # Percentage complete
-        percent = min(100, max(0, (days_elapsed / self._pregnancy_length) * 100))
-        
-        # Trimester (1, 2, or 3)
-        if weeks_elapsed < 13:
-            trimester = 1
-        elif weeks_elapsed < 27:
-            trimester = 2
-        else:
-            trimester = 3
-        
-        # Status
-        if days_remaining < 0:
-            status = "overdue"
-        elif days_remaining == 0:
-            status = "due_today"
-        elif weeks_elapsed < 1:
-            status = "just_started"
-        else:
-            status = "in_progress"
-        
-        return {
-            "days_elapsed": days_elapsed,
-            "days_remaining": days_remaining,
-            "weeks_elapsed": weeks_elapsed,
-            "percent": round(percent, 1),
-            "trimester": trimester,
-            "status": status,
-        }
-
-
-class PregnancyWeeksSensor(PregnancyTrackerSensorBase):
-    """Sensor for weeks elapsed."""
-
-    _attr_icon = "mdi:calendar-week"
-    _attr_native_unit_of_measurement = "weeks"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_WEEKS}"
-        self._attr_name = "Weeks"
-
-    @property
-    def native_value(self) -> int:
-        """Return the state of the sensor."""
-        values = self._calculate_values()
-        return values["weeks_elapsed"]
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        values = self._calculate_values()
-        days_into_week = values["days_elapsed"] % 7
-        return {
-            "days_into_week": days_into_week,
-            "week_description": f"{values['weeks_elapsed']}+{days_into_week}",
-        }
-
-
-class PregnancyDaysElapsedSensor(PregnancyTrackerSensorBase):
-    """Sensor for days elapsed."""
-
-    _attr_icon = "mdi:calendar-check"
-    _attr_native_unit_of_measurement = "days"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_DAYS_ELAPSED}"
-        self._attr_name = "Days Elapsed"
-
-    @property
-    def native_value(self) -> int:
-        """Return the state of the sensor."""
-        values = self._calculate_values()
-        return values["days_elapsed"]
-
-
-class PregnancyDaysRemainingSensor(PregnancyTrackerSensorBase):
-    """Sensor for days remaining."""
-
-    _attr_icon = "mdi:calendar-clock"
-    _attr_native_unit_of_measurement = "days"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_DAYS_REMAINING}"
-        self._attr_name = "Days Remaining"
-
-    @property
-    def native_value(self) -> int:
-        """Return the state of the sensor."""
-        values = self._calculate_values()
-        return values["days_remaining"]
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        return {
-            "due_date": self._due_date.isoformat(),
-        }
-
-
-class PregnancyPercentSensor(PregnancyTrackerSensorBase):
-    """Sensor for percentage complete."""
-
-    _attr_icon = "mdi:percent"
-    _attr_native_unit_of_measurement = "%"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_PERCENT}"
-        self._attr_name = "Percent Complete"
-
-    @property
-    def native_value(self) -> float:
-        """Return the state of the sensor."""
-        values = self._calculate_values()
-        return values["percent"]
-
-
-class PregnancyTrimesterSensor(PregnancyTrackerSensorBase):
-    """Sensor for trimester."""
-
-    _attr_icon = "mdi:numeric"
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_TRIMESTER}"
-        self._attr_name = "Trimester"
-
-    @property
-    def native_value(self) -> int:
-        """Return the state of the sensor."""
-        values = self._calculate_values()
-        return values["trimester"]
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        values = self._calculate_values()
-        trimester_names = {
-            1: "First Trimester",
-            2: "Second Trimester",
-            3: "Third Trimester",
-        }
-        return {
-            "trimester_name": trimester_names.get(values["trimester"], "Unknown"),
-        }
-
-
-class PregnancyStatusSensor(PregnancyTrackerSensorBase):
-    """Sensor for pregnancy status."""
-
-    _attr_icon = "mdi:information"
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_STATUS}"
-        self._attr_name = "Status"
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        values = self._calculate_values()
-        status_map = {
-            "overdue": "Overdue",
-            "due_today": "Due Today",
-            "just_started": "Just Started",
-            "in_progress": "In Progress",
-        }
-        return status_map.get(values["status"], "Unknown")
-
-
-class PregnancySizeComparisonSensor(PregnancyTrackerSensorBase):
-    """Sensor for size comparison."""
-
-    _attr_icon = "mdi:ruler"
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_SIZE_COMPARISON}"
-        self._attr_name = "Size Comparison"
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        values = self._calculate_values()
-        week = values["weeks_elapsed"]
-        veggie_data = get_comparison(week, "veggie")
-        return veggie_data["label"]
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes with all comparison modes and emojis."""
-        values = self._calculate_values()
-        week = values["weeks_elapsed"]
-        
-        comparisons = get_all_comparisons(week)
-        
-        return {
-            "week": week,
-            "veggie": comparisons["veggie"]["label"],
-            "dad": comparisons["dad"]["label"],
-            "veggie_image": comparisons["veggie"].get("image"),
-            "dad_image": comparisons["dad"].get("image"),
-        }
-
-
-class PregnancyDadSizeComparisonSensor(PregnancyTrackerSensorBase):
-    """Sensor for dad-mode size comparison."""
-
-    _attr_icon = "mdi:ruler"
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_DAD_SIZE_COMPARISON}"
-        self._attr_name = "Dad Size Comparison"
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        values = self._calculate_values()
-        week = values["weeks_elapsed"]
-        dad_data = get_comparison(week, "dad")
-        return dad_data["label"]
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        values = self._calculate_values()
-        week = values["weeks_elapsed"]
-        comparisons = get_all_comparisons(week)
-        return {
-            "week": week,
-            "veggie": comparisons["veggie"]["label"],
-            "dad": comparisons["dad"]["label"],
-            "veggie_image": comparisons["veggie"].get("image"),
-            "dad_image": comparisons["dad"].get("image"),
-        }
-
-
-class PregnancySizeComparisonImageSensor(PregnancyTrackerSensorBase):
-    """Sensor exposing image URLs for size comparisons."""
-
-    _attr_icon = "mdi:image-outline"
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_SIZE_COMPARISON_IMAGE}"
-        self._attr_name = "Size Comparison Image"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the primary image URL (veggie) for convenience."""
-        values = self._calculate_values()
-        week = values["weeks_elapsed"]
-        comparisons = get_all_comparisons(week)
-        return comparisons["veggie"].get("image")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return both veggie and dad image URLs plus labels."""
-        values = self._calculate_values()
-        week = values["weeks_elapsed"]
-        comparisons = get_all_comparisons(week)
-        return {
-            "week": week,
-            "veggie": comparisons["veggie"]["label"],
-            "veggie_image": comparisons["veggie"].get("image"),
-            "dad": comparisons["dad"]["label"],
-            "dad_image": comparisons["dad"].get("image"),
-        }
-
-
-class PregnancyCountdownSensor(PregnancyTrackerSensorBase):
-    """Sensor for countdown to due date."""
-
-    _attr_icon = "mdi:timer-outline"
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_COUNTDOWN}"
-        self._attr_name = "Countdown"
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        values = self._calculate_values()
-        days_remaining = values["days_remaining"]
-        weeks_remaining = days_remaining // 7
-        days_in_week = days_remaining % 7
-        
-        if days_remaining < 0:
-            return f"Overdue by {abs(days_remaining)} days"
-        elif days_remaining == 0:
-            return "Due today!"
-        elif weeks_remaining == 0:
-            return f"{days_remaining} days"
-        else:
-            return f"{weeks_remaining}w {days_in_week}d"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        values = self._calculate_values()
-        days_remaining = values["days_remaining"]
-        
-        return {
-            "days_remaining": days_remaining,
-            "weeks_remaining": days_remaining // 7,
-            "days_in_week": days_remaining % 7,
-            "due_date": self._due_date.isoformat(),
-        }
-
-
-class PregnancyDueDateRangeSensor(PregnancyTrackerSensorBase):
-    """Sensor for due date range."""
-
-    _attr_icon = "mdi:calendar-range"
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_DUE_DATE_RANGE}"
-        self._attr_name = "Due Date Range"
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        early_date = (self._due_date - timedelta(days=14)).strftime("%b %d")
-        late_date = (self._due_date + timedelta(days=14)).strftime("%b %d")
-        return f"{early_date} - {late_date}"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        values = self._calculate_values()
-        weeks = values["weeks_elapsed"]
-        
-        # Calculate term status
-        if weeks < 37:
-            term_status = "Preterm"
-        elif weeks < 39:
-            term_status = "Early term"
-        elif weeks < 41:
-            term_status = "Full term"
-        elif weeks < 42:
-            term_status = "Late term"
-        else:
-            term_status = "Post term"
-        
-        return {
-            "early_date": (self._due_date - timedelta(days=14)).isoformat(),
-            "due_date": self._due_date.isoformat(),
-            "late_date": (self._due_date + timedelta(days=14)).isoformat(),
-            "term_status": term_status,
-        }
-
-
-class PregnancyWeeklySummarySensor(PregnancyTrackerSensorBase):
-    """Sensor for weekly development summary."""
-
-    _attr_icon = "mdi:text-box-outline"
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_WEEKLY_SUMMARY}"
-        self._attr_name = "Weekly Summary"
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        values = self._calculate_values()
-        week = values["weeks_elapsed"]
-        return get_weekly_summary(week)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        values = self._calculate_values()
-        return {
-            "week": values["weeks_elapsed"],
-        }
+    async_add_entities(
+        PregnancyTrackerSensor(tracker, description, device_info)
+        for description in SENSOR_DESCRIPTIONS
+    )
 
 
-class PregnancyMilestoneSensor(PregnancyTrackerSensorBase):
-    """Sensor for pregnancy milestones."""
+class PregnancyTrackerSensor(SensorEntity):
+    """Pregnancy Tracker sensor driven by an entity description."""
 
-    _attr_icon = "mdi:trophy-outline"
+    _attr_has_entity_name = True
+    # The tracker pushes updates when values change
+    _attr_should_poll = False
+    entity_description: PregnancyTrackerSensorEntityDescription
 
     def __init__(
         self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
+        tracker: PregnancyTracker,
+        description: PregnancyTrackerSensorEntityDescription,
         device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_MILESTONE}"
-        self._attr_name = "Milestone"
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        values = self._calculate_values()
-        week = values["weeks_elapsed"]
-        
-        # Define milestones
-        if week >= 40:
-            return "Due date reached!"
-        elif week >= 37:
-            return "Full term"
-        elif week >= 27:
-            return "Third trimester"
-        elif week >= 24:
-            return "Viability"
-        elif week >= 13:
-            return "Second trimester"
-        elif week >= 5:
-            return "Heartbeat detected"
-        else:
-            return "Early pregnancy"
+        self.entity_description = description
+        self._tracker = tracker
+        self._attr_unique_id = f"{tracker.entry_id}_{description.key}"
+        self._attr_device_info = device_info
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        values = self._calculate_values()
-        week = values["weeks_elapsed"]
-        
-        # Track which milestones have been reached
-        milestones_reached = []
-        if week >= 5:
-            milestones_reached.append("Heartbeat detected (Week 5)")
-        if week >= 13:
-            milestones_reached.append("Second trimester (Week 13)")
-        if week >= 24:
-            milestones_reached.append("Viability (Week 24)")
-        if week >= 27:
-            milestones_reached.append("Third trimester (Week 27)")
-        if week >= 37:
-            milestones_reached.append("Full term (Week 37)")
-        if week >= 40:
-            milestones_reached.append("Due date (Week 40)")
-        
-        # Calculate next milestone
-        next_milestone = None
-        next_milestone_weeks = None
-        if week < 5:
-            next_milestone = "Heartbeat detected"
-            next_milestone_weeks = 5 - week
-        elif week < 13:
-            next_milestone = "Second trimester"
-            next_milestone_weeks = 13 - week
-        elif week < 24:
-            next_milestone = "Viability"
-            next_milestone_weeks = 24 - week
-        elif week < 27:
-            next_milestone = "Third trimester"
-            next_milestone_weeks = 27 - week
-        elif week < 37:
-            next_milestone = "Full term"
-            next_milestone_weeks = 37 - week
-        elif week < 40:
-            next_milestone = "Due date"
-            next_milestone_weeks = 40 - week
-        
-        return {
-            "week": week,
-            "milestones_reached": milestones_reached,
-            "milestone_count": len(milestones_reached),
-            "next_milestone": next_milestone,
-            "weeks_to_next_milestone": next_milestone_weeks,
-        }
-
-
-class PregnancyBibleVerseSensor(PregnancyTrackerSensorBase):
-    """Sensor for weekly Bible verse."""
-
-    _attr_icon = "mdi:book-open-variant"
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-        custom_bible_verses: str = "",
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_BIBLE_VERSE}"
-        self._attr_name = "Bible Verse"
-        self._custom_bible_verses = custom_bible_verses
+    async def async_added_to_hass(self) -> None:
+        """Update in place when the entry's options, verses or images change."""
+        self.async_on_remove(self._tracker.async_add_listener(self.async_write_ha_state))
+        if self._tracker.archived:
+            return
+        if self.entity_description.uses_time:
+            self.async_on_remove(
+                self._tracker.async_add_tick_listener(self.async_write_ha_state)
+            )
+        if self.entity_description.uses_verses:
+            self.async_on_remove(
+                self._tracker.verses.async_add_listener(self.async_write_ha_state)
+            )
+        if self.entity_description.uses_images:
+            self.async_on_remove(
+                self._tracker.images.async_add_listener(self.async_write_ha_state)
+            )
 
     @property
-    def native_value(self) -> str:
+    def native_value(self) -> StateType | date | datetime:
         """Return the state of the sensor."""
-        values = self._calculate_values()
-        week = values["weeks_elapsed"]
-        verse_data = get_bible_verse(week, self._custom_bible_verses if self._custom_bible_verses else None)
-        return verse_data["text"]
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        values = self._calculate_values()
-        week = values["weeks_elapsed"]
-        verse_data = get_bible_verse(week, self._custom_bible_verses if self._custom_bible_verses else None)
-        return {
-            "week": week,
-            "reference": verse_data["reference"],
-            "text": verse_data["text"],
-            "custom_verses_enabled": bool(self._custom_bible_verses),
-        }
-
-
-class PregnancyBibleVerseReferenceSensor(PregnancyTrackerSensorBase):
-    """Sensor for Bible verse reference (book and chapter)."""
-
-    _attr_icon = "mdi:bookmark-outline"
-
-    def __init__(
-        self,
-        config_entry: ConfigEntry,
-        due_date: date,
-        start_date: date,
-        pregnancy_length: int,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(config_entry, due_date, start_date, pregnancy_length, device_info)
-        self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_BIBLE_VERSE_REFERENCE}"
-        self._attr_name = "Bible Verse Reference"
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor (book and chapter)."""
-        values = self._calculate_values()
-        week = values["weeks_elapsed"]
-        verse_data = get_bible_verse(week)
-        reference_parts = parse_bible_reference(verse_data["reference"])
-        return reference_parts["book_and_chapter"]
+        return self.entity_description.value_fn(self._tracker, self._tracker.calculate_values())
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional attributes."""
-        values = self._calculate_values()
-        week = values["weeks_elapsed"]
-        verse_data = get_bible_verse(week)
-        reference_parts = parse_bible_reference(verse_data["reference"])
-        return {
-            "week": week,
-            "book": reference_parts["book"],
-            "chapter": reference_parts["chapter"],
-            "verse": reference_parts["verse"],
-            "full_reference": verse_data["reference"],
-        }
+        if self.entity_description.attr_fn is None:
+            return None
+        return self.entity_description.attr_fn(self._tracker, self._tracker.calculate_values())
@@ -0,0 +1,151 @@
+"""Compact JSON snapshots of the trackers for external displays."""
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import date
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .calculations import get_countdown, get_milestone, get_milestone_progress
+from .comparisons import get_all_comparisons
+from .const import DOMAIN
+from .growth import get_growth
+from .tracker import PregnancyTracker
+
+# A snapshot is current for its tracker instance, local day and tracker revision
+SnapshotKey = tuple[PregnancyTracker, date, int]
+
+SNAPSHOT_URL = "/api/pregnancy_tracker/snapshot"
+
+# Clients may keep a snapshot but must revalidate it with its ETag
+SNAPSHOT_CACHE_CONTROL = "private, no-cache"
+
+
+def build_snapshot(tracker: PregnancyTracker, values: dict[str, Any]) -> dict[str, Any]:
+    """Build the snapshot of a tracker for the values of a day."""
+    week = values["weeks_elapsed"]
+    comparisons = get_all_comparisons(week)
+    progress = get_milestone_progress(week, tracker.milestones)
+    verse = tracker.verses.verse(week)
+    growth = get_growth(values["days_elapsed"])
+    return {
+        "entry_id": tracker.entry_id,
+        "name": tracker.device_name,
+        "due_date": tracker.due_date.isoformat(),
+        "pregnancy_length": tracker.pregnancy_length,
+        "archived_on": tracker.archived_on.isoformat() if tracker.archived_on else None,
+        "week": week,
+        "day": values["days_elapsed"] % 7,
+        "days_elapsed": values["days_elapsed"],
+        "days_remaining": values["days_remaining"],
+        "percent": values["percent"],
+        "trimester": values["trimester"],
+        "status": values["status"],
+        "countdown": get_countdown(values["days_remaining"]),
+        "milestone": get_milestone(week, tracker.milestones),
+        "next_milestone": progress["next_milestone"],
+        "weeks_to_next_milestone": progress["weeks_to_next_milestone"],
+        "comparison": {
+            mode: {"label": comparison["label"], "image": tracker.images.url(mode, week)}
+            for mode, comparison in comparisons.items()
+        },
+        "summary": tracker.verses.summary(week),
+        "verse": {"text": verse.text, "reference": verse.reference},
+        "estimated_length_cm": growth.length_cm,
+        "estimated_weight_g": growth.weight_g,
+    }
+
+
+def _etag(body: bytes) -> str:
+    """Return a strong ETag for a response body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+
+class SnapshotView(HomeAssistantView):
+    """Serve the snapshot of one or all trackers with conditional GET.
+
+    Snapshots only change once a day or when a tracker's options, verses or
+    images change, so each one is built and encoded once per local day and
+    tracker revision. Pollers that send back the ETag get a 304 without a
+    body.
+    """
+
+    url = SNAPSHOT_URL
+    extra_urls = [SNAPSHOT_URL + "/{entry_id}"]
+    name = "api:pregnancy_tracker:snapshot"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+        # entry_id -> ((tracker, day, revision), snapshot)
+        self._snapshots: dict[str, tuple[SnapshotKey, dict[str, Any]]] = {}
+        # cache key -> (body, etag)
+        self._responses: dict[Any, tuple[bytes, str]] = {}
+
+    async def get(self, request: web.Request, entry_id: str | None = None) -> web.Response:
+        """Return the snapshot of one tracker, or of all trackers."""
+        trackers = _trackers(self.hass)
+        self._snapshots = {
+            key: value for key, value in self._snapshots.items() if key in trackers
+        }
+        self._responses = {
+            key: value
+            for key, value in self._responses.items()
+            if key[0] is None or key[0] in trackers
+        }
+        if entry_id is not None:
+            if entry_id not in trackers:
+                return self.json_message("Tracker not found", HTTPStatus.NOT_FOUND)
+            trackers = {entry_id: trackers[entry_id]}
+
+        keys = [
+            (tracker.entry_id, await self._async_snapshot_key(tracker))
+            for tracker in trackers.values()
+        ]
+        cache_key = (entry_id, tuple(keys))
+        if (cached := self._responses.get(cache_key)) is None:
+            if entry_id is not None:
+                data: Any = self._snapshots[entry_id][1]
+            else:
+                data = {"trackers": [self._snapshots[key][1] for key, _ in keys]}
+            body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+            cached = (body, _etag(body))
+            # Only the latest response of each URL is kept
+            self._responses = {
+                key: value for key, value in self._responses.items() if key[0] != entry_id
+            }
+            self._responses[cache_key] = cached
+
+        body, etag = cached
+        headers = {hdrs.ETAG: etag, hdrs.CACHE_CONTROL: SNAPSHOT_CACHE_CONTROL}
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH, "")
+        if if_none_match.strip() == "*" or etag in (
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    async def _async_snapshot_key(self, tracker: PregnancyTracker) -> SnapshotKey:
+        """Make sure the tracker's snapshot is current and return its cache key."""
+        values = tracker.calculate_values()
+        key = (tracker, tracker.today, tracker.revision)
+        cached = self._snapshots.get(tracker.entry_id)
+        if cached is None or cached[0] != key:
+            await tracker.verses.async_ensure_day(values["days_elapsed"])
+            self._snapshots[tracker.entry_id] = (key, build_snapshot(tracker, values))
+        return key
+
+
+def _trackers(hass: HomeAssistant) -> dict[str, PregnancyTracker]:
+    """Return the loaded trackers by entry ID."""
+    return {
+        entry_id: tracker
+        for entry_id, tracker in hass.data.get(DOMAIN, {}).items()
+        if isinstance(tracker, PregnancyTracker)
+    }
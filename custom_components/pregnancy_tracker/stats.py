@@ -0,0 +1,188 @@
+"""Long-term statistics for Pregnancy Tracker.
+
+The tracked values change once a day, so instead of letting the recorder
+sample them every five minutes, one point per day is imported as external
+statistics. The days missing since the last stored point are imported at
+setup, so charts are complete even for trackers added mid-pregnancy.
+
+The recorder is only imported once it is loaded; it pulls in database and
+system libraries the rest of the integration does not need.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
+
+from .calculations import calculate_values
+from .const import (
+    DOMAIN,
+    SENSOR_WEEKS,
+    SENSOR_DAYS_ELAPSED,
+    SENSOR_DAYS_REMAINING,
+    SENSOR_PERCENT,
+)
+
+if TYPE_CHECKING:
+    from .tracker import PregnancyTracker
+
+# Sensor key -> (calculated value, unit, name) of the daily statistics
+DAILY_STATISTICS = {
+    SENSOR_WEEKS: ("weeks_elapsed", "weeks", "Weeks"),
+    SENSOR_DAYS_ELAPSED: ("days_elapsed", "days", "Days Elapsed"),
+    SENSOR_DAYS_REMAINING: ("days_remaining", "days", "Days Remaining"),
+    SENSOR_PERCENT: ("percent", "%", "Percent Complete"),
+}
+
+
+def statistic_id(entry_id: str, key: str) -> str:
+    """Return the external statistic id of a tracker value."""
+    return f"{DOMAIN}:{entry_id.lower()}_{key}"
+
+
+@callback
+def async_clear_statistics(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the statistics of a tracker, if the recorder is loaded."""
+    if "recorder" not in hass.config.components:
+        return
+    from homeassistant.components.recorder import get_instance
+
+    get_instance(hass).async_clear_statistics(
+        [statistic_id(entry_id, key) for key in DAILY_STATISTICS]
+    )
+
+
+class TrackerStatistics:
+    """Import one statistics point per day for a tracker."""
+
+    def __init__(self, hass: HomeAssistant, tracker: PregnancyTracker) -> None:
+        """Initialize the statistics."""
+        self.hass = hass
+        self._tracker = tracker
+        self._unsub_time: CALLBACK_TYPE | None = None
+        self._import_task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Import the days missing since the last point and add one each new day."""
+        if "recorder" not in self.hass.config.components:
+            return
+        self._import_task = self.hass.async_create_background_task(
+            self._async_import_missing(), f"{DOMAIN} import statistics"
+        )
+        self._async_track_days()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop adding daily points."""
+        if self._import_task is not None:
+            self._import_task.cancel()
+            self._import_task = None
+        if self._unsub_time is not None:
+            self._unsub_time()
+            self._unsub_time = None
+
+    @callback
+    def async_reset(self) -> None:
+        """Replace the statistics after the due date or length changed."""
+        if "recorder" not in self.hass.config.components:
+            return
+        self.async_stop()
+        async_clear_statistics(self.hass, self._tracker.entry_id)
+        # The recorder clears before it imports, so the whole period is re-added
+        self._async_import(self._tracker.start_date, dt_util.now().date())
+        self._async_track_days()
+
+    @callback
+    def _async_track_days(self) -> None:
+        """Add a point shortly after each midnight, so the new day's values are used."""
+        self._unsub_time = async_track_time_change(
+            self.hass, self._async_new_day, hour=0, minute=0, second=10
+        )
+
+    async def _async_import_missing(self) -> None:
+        """Import the days after the last stored point through today."""
+        from homeassistant.components.recorder import get_instance
+
+        last_day = await get_instance(self.hass).async_add_executor_job(self._last_stored_day)
+        first = self._tracker.start_date if last_day is None else last_day + timedelta(days=1)
+        self._import_task = None
+        self._async_import(first, dt_util.now().date())
+
+    def _last_stored_day(self) -> date | None:
+        """Return the last day stored for every statistic, or None if one has none.
+
+        This reads from the database and must be run in the recorder's executor.
+        """
+        from homeassistant.components.recorder.statistics import get_last_statistics
+
+        last_days: list[date] = []
+        for key in DAILY_STATISTICS:
+            stat_id = statistic_id(self._tracker.entry_id, key)
+            rows = get_last_statistics(self.hass, 1, stat_id, False, {"mean"}).get(stat_id)
+            if not rows:
+                return None
+            start = dt_util.utc_from_timestamp(rows[0]["start"])
+            last_days.append(dt_util.as_local(start).date())
+        return min(last_days)
+
+    @callback
+    def _async_new_day(self, now: datetime) -> None:
+        """Add the point of a new day."""
+        today = now.date()
+        self._async_import(today, today)
+
+    @callback
+    def _async_import(self, first: date, last: date) -> None:
+        """Import the daily points from first through last."""
+        from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+        from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+        try:
+            from homeassistant.components.recorder.models import StatisticMeanType
+        except ImportError:  # Home Assistant before 2025.4
+            StatisticMeanType = None
+
+        tracker = self._tracker
+        first = max(first, tracker.start_date)
+        if first > last:
+            return
+
+        days: list[tuple[datetime, dict[str, Any]]] = []
+        day = first
+        while day <= last:
+            values = calculate_values(
+                tracker.start_date, tracker.due_date, tracker.pregnancy_length, day
+            )
+            days.append((dt_util.start_of_local_day(day), values))
+            day += timedelta(days=1)
+
+        for key, (value_key, unit, name) in DAILY_STATISTICS.items():
+            metadata = StatisticMetaData(
+                has_sum=False,
+                name=f"{tracker.device_name} {name}",
+                source=DOMAIN,
+                statistic_id=statistic_id(tracker.entry_id, key),
+                unit_of_measurement=unit,
+            )
+            if StatisticMeanType is not None:
+                metadata["mean_type"] = StatisticMeanType.ARITHMETIC
+            else:
+                metadata["has_mean"] = True
+            async_add_external_statistics(
+                self.hass,
+                metadata,
+                [
+                    StatisticData(
+                        start=start,
+                        mean=values[value_key],
+                        min=values[value_key],
+                        max=values[value_key],
+                    )
+                    for start, values in days
+                ],
+            )
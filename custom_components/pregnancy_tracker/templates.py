@@ -0,0 +1,197 @@
+"""Template functions for Pregnancy Tracker.
+
+Adds pregnancy_week, pregnancy_comparison and pregnancy_verse to Home
+Assistant templates, as globals and as filters::
+
+    {{ pregnancy_week('2027-03-01') }}
+    {{ 'ENTRY_ID' | pregnancy_comparison('dad') }}
+    {{ pregnancy_verse('ENTRY_ID').reference }}
+
+The first argument is a config entry ID or a due date. The values come
+from the same calculations as the sensors, memoized per due date, length
+and local day, so templates get them without depending on entity states.
+"""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from functools import lru_cache, wraps
+from typing import Any
+
+from jinja2 import pass_context
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import template
+from homeassistant.util import dt as dt_util
+
+from .calculations import calculate_values
+from .comparisons import DEFAULT_VERSE_TABLE, get_comparison
+from .const import COMPARISON_MODE_VEGGIE, DEFAULT_PREGNANCY_LENGTH, DOMAIN
+from .tracker import PregnancyTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of (due date, length, day) results kept for templates
+TEMPLATE_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _cached_values(due_date: date, pregnancy_length: int, day: date) -> dict[str, Any]:
+    """Return the pregnancy values of a day, memoized."""
+    start_date = due_date - timedelta(days=pregnancy_length)
+    return calculate_values(start_date, due_date, pregnancy_length, day)
+
+
+def _as_date(value: Any, name: str) -> date:
+    """Convert a date, datetime or ISO string template argument to a local date."""
+    if isinstance(value, datetime):
+        return dt_util.as_local(value).date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        if (parsed := dt_util.parse_date(value)) is not None:
+            return parsed
+        if (parsed_dt := dt_util.parse_datetime(value)) is not None:
+            return dt_util.as_local(parsed_dt).date()
+    raise ValueError(f"{name} must be a date, got '{value}'")
+
+
+def _mark_has_time() -> None:
+    """Re-render templates that use today's values like they use now().
+
+    This relies on Home Assistant internals; if they change, templates
+    still render but are only refreshed when something else changes.
+    """
+    render_info_cv = getattr(template, "_render_info", None)
+    try:
+        if render_info_cv is not None and (render_info := render_info_cv.get()) is not None:
+            render_info.has_time = True
+    except (AttributeError, TypeError):
+        pass
+
+
+def _resolve(
+    hass: HomeAssistant, entry_or_due_date: Any, length: int | None, as_of: Any
+) -> tuple[PregnancyTracker | None, dict[str, Any], bool]:
+    """Return the tracker (if any), the pregnancy values and whether as_of is today.
+
+    Today is an archived tracker's archive day, which never changes.
+    """
+    tracker = None
+    if isinstance(entry_or_due_date, str):
+        tracker = hass.data.get(DOMAIN, {}).get(entry_or_due_date)
+    if isinstance(tracker, PregnancyTracker):
+        due_date, pregnancy_length = tracker.due_date, tracker.pregnancy_length
+        today = tracker.today
+    else:
+        tracker = None
+        due_date = _as_date(entry_or_due_date, "entry_or_due_date")
+        pregnancy_length = length or DEFAULT_PREGNANCY_LENGTH
+        today = dt_util.now().date()
+
+    if as_of is None:
+        if tracker is None or not tracker.archived:
+            _mark_has_time()
+        day = today
+    else:
+        day = _as_date(as_of, "as_of")
+    return tracker, _cached_values(due_date, pregnancy_length, day), day == today
+
+
+def pregnancy_week(
+    hass: HomeAssistant, entry_or_due_date: Any, as_of: Any = None, length: int | None = None
+) -> int:
+    """Return the completed weeks of a pregnancy on a day."""
+    _, values, _ = _resolve(hass, entry_or_due_date, length, as_of)
+    return values["weeks_elapsed"]
+
+
+def pregnancy_comparison(
+    hass: HomeAssistant,
+    entry_or_due_date: Any,
+    mode: str = COMPARISON_MODE_VEGGIE,
+    as_of: Any = None,
+    length: int | None = None,
+) -> str:
+    """Return the size comparison label of a pregnancy on a day."""
+    _, values, _ = _resolve(hass, entry_or_due_date, length, as_of)
+    return get_comparison(values["weeks_elapsed"], mode)["label"]
+
+
+def pregnancy_verse(
+    hass: HomeAssistant, entry_or_due_date: Any, as_of: Any = None, length: int | None = None
+) -> dict[str, str]:
+    """Return the Bible verse of a pregnancy on a day as text and reference.
+
+    Entries use their custom verses; today's verse of an entry with a verse
+    library is that day's verse, as shown by the sensor.
+    """
+    tracker, values, today = _resolve(hass, entry_or_due_date, length, as_of)
+    week = values["weeks_elapsed"]
+    if tracker is None:
+        verse = DEFAULT_VERSE_TABLE.get(week)
+    elif today:
+        verse = tracker.verses.verse(week)
+    else:
+        verse = tracker.verses.table.get(week)
+    return {"text": verse.text, "reference": verse.reference}
+
+
+TEMPLATE_FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "pregnancy_week": pregnancy_week,
+    "pregnancy_comparison": pregnancy_comparison,
+    "pregnancy_verse": pregnancy_verse,
+}
+
+
+@callback
+def async_setup_template_functions(hass: HomeAssistant) -> None:
+    """Add the template functions to Home Assistant's template environments.
+
+    Home Assistant has no public API for this, so the shared environments
+    it keeps in hass.data are created up front and extended. If they are
+    not where they are expected the functions are skipped with a warning
+    instead of failing the setup. Limited templates are left alone.
+    """
+    environment_keys = [
+        (getattr(template, name, None), strict)
+        for name, strict in (("_ENVIRONMENT", False), ("_ENVIRONMENT_STRICT", True))
+    ]
+    environment_class = getattr(template, "TemplateEnvironment", None)
+    if environment_class is None or any(key is None for key, _ in environment_keys):
+        _LOGGER.warning(
+            "Pregnancy template functions are not supported by this Home Assistant version"
+        )
+        return
+
+    environments = []
+    try:
+        for key, strict in environment_keys:
+            if (environment := hass.data.get(key)) is None:
+                environment = environment_class(hass, False, strict)
+            environments.append((key, environment, environment.globals, environment.filters))
+    except (AttributeError, TypeError) as err:
+        # Leave Home Assistant's environments untouched if they changed shape
+        _LOGGER.warning("Pregnancy template functions could not be added: %s", err)
+        return
+
+    for key, environment, globals_, filters in environments:
+        hass.data.setdefault(key, environment)
+        for name, func in TEMPLATE_FUNCTIONS.items():
+            globals_[name] = filters[name] = _hass_function(hass, func)
+
+
+def _hass_function(hass: HomeAssistant, func: Callable[..., Any]) -> Callable[..., Any]:
+    """Bind a template function to hass.
+
+    The function is marked as needing the context so Jinja evaluates it on
+    every render instead of folding a constant call in at compile time.
+    """
+
+    @pass_context
+    @wraps(func)
+    def wrapper(_context: Any, *args: Any, **kwargs: Any) -> Any:
+        return func(hass, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,314 @@
+"""Shared per-entry state for Pregnancy Tracker."""
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .calculations import (
+    MILESTONE_RULES,
+    calculate_values,
+    get_next_refresh,
+    get_refresh_cadence,
+    parse_custom_milestones,
+)
+from .const import (
+    DOMAIN,
+    CONF_DUE_DATE,
+    CONF_PREGNANCY_LENGTH,
+    CONF_CUSTOM_BIBLE_VERSES,
+    CONF_BIBLE_TRANSLATION,
+    CONF_NOTIFY_SERVICE,
+    CONF_NOTIFY_TIME,
+    CONF_NOTIFY_CADENCE,
+    CONF_CUSTOM_MILESTONES,
+    CONF_DUE_TIME,
+    CONF_ARCHIVE_AFTER_DAYS,
+    CONF_ARCHIVED_ON,
+    DEFAULT_PREGNANCY_LENGTH,
+    DEFAULT_ARCHIVE_AFTER_DAYS,
+    DEFAULT_NOTIFY_TIME,
+    DEFAULT_NOTIFY_CADENCE,
+)
+from .images import ComparisonImages
+from .notifier import DigestNotifier
+from .stats import TrackerStatistics
+from .verse_watcher import VerseSource, VerseTables
+
+
+def _notify_options(data: Mapping[str, Any]) -> tuple[str, str, str]:
+    """Return the digest notification options from config entry data."""
+    return (
+        data.get(CONF_NOTIFY_SERVICE, ""),
+        data.get(CONF_NOTIFY_TIME, DEFAULT_NOTIFY_TIME),
+        data.get(CONF_NOTIFY_CADENCE, DEFAULT_NOTIFY_CADENCE),
+    )
+
+
+class PregnancyTracker:
+    """Calculation state shared by all entities of a config entry.
+
+    Entities read the due date, start date and pregnancy length from here
+    instead of keeping their own copies, so changed options can be applied
+    in place without reloading the entry.
+
+    The tracker also drives the entity updates: everything is refreshed at
+    midnight and, when a due time is set, the countdown hourly in the final
+    week and every minute on the final day before it. Nothing is polled in
+    between.
+
+    An archived tracker keeps showing the values of the day it was archived
+    on and starts no timers or watchers at all; entering or leaving the
+    archive reloads the entry.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        images: ComparisonImages,
+        verse_tables: VerseTables,
+    ) -> None:
+        """Initialize the tracker from the config entry data."""
+        self.hass = hass
+        self.entry_id = entry.entry_id
+        self.images = images
+        self._listeners: list[Callable[[], None]] = []
+        self._tick_listeners: list[Callable[[], None]] = []
+        self._unsub_content: list[CALLBACK_TYPE] = []
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+        self._refreshed_on: date | None = None
+        # Bumped whenever the configuration, verses or images change
+        self.revision = 0
+        self._values: dict[str, Any] = {}
+        self._values_date: date | None = None
+        self._set_config(entry.data)
+        self.verses = VerseSource(
+            hass,
+            verse_tables,
+            self.entry_id,
+            entry.data.get(CONF_CUSTOM_BIBLE_VERSES, ""),
+            entry.data.get(CONF_BIBLE_TRANSLATION, ""),
+        )
+        self.notifier = DigestNotifier(hass, self, *_notify_options(entry.data))
+        self.statistics = TrackerStatistics(hass, self)
+
+    def _set_config(self, data: Mapping[str, Any]) -> None:
+        """Apply due date, pregnancy length and milestones from config entry data."""
+        self.due_date_str: str = data[CONF_DUE_DATE]
+        self.pregnancy_length: int = data.get(CONF_PREGNANCY_LENGTH, DEFAULT_PREGNANCY_LENGTH)
+        self.due_date = datetime.strptime(self.due_date_str, "%Y-%m-%d").date()
+        self.start_date = self.due_date - timedelta(days=self.pregnancy_length)
+        # Without a due time the countdown stays in weeks and days and the
+        # due date is taken to start at midnight
+        self.has_due_time = bool(data.get(CONF_DUE_TIME))
+        due_time = dt_util.parse_time(data.get(CONF_DUE_TIME) or "00:00:00")
+        self.due_at = dt_util.start_of_local_day(self.due_date).replace(
+            hour=due_time.hour, minute=due_time.minute, second=due_time.second
+        )
+        self.milestones = MILESTONE_RULES.extend(
+            parse_custom_milestones(data.get(CONF_CUSTOM_MILESTONES, ""))
+        )
+        self.archive_after_days: int = data.get(
+            CONF_ARCHIVE_AFTER_DAYS, DEFAULT_ARCHIVE_AFTER_DAYS
+        )
+        archived_on = data.get(CONF_ARCHIVED_ON)
+        self.archived_on: date | None = (
+            date.fromisoformat(archived_on) if archived_on else None
+        )
+        self._values_date = None
+
+    @property
+    def device_name(self) -> str:
+        """Return the name of the tracker's device."""
+        return f"Pregnancy Tracker {self.due_date_str}"
+
+    @property
+    def archived(self) -> bool:
+        """Return whether the tracker is archived."""
+        return self.archived_on is not None
+
+    @property
+    def today(self) -> date:
+        """Return the day the values are shown for."""
+        if self.archived_on is not None:
+            return self.archived_on
+        return dt_util.now().date()
+
+    async def async_setup(self) -> None:
+        """Load content needed by the entities."""
+        if self.async_archive_if_due():
+            self._set_config(self.hass.config_entries.async_get_entry(self.entry_id).data)
+        if self.archived:
+            # Load the frozen day's content once, without watching anything
+            await self.verses.async_load(watch=False)
+            await self.verses.async_ensure_day(self.calculate_values()["days_elapsed"])
+            return
+
+        self._refreshed_on = self.today
+        self._async_schedule_refresh()
+        await self.verses.async_load()
+        await self.verses.async_ensure_day(self.calculate_values()["days_elapsed"])
+        self._unsub_content = [
+            self.verses.async_add_listener(self._async_content_changed),
+            self.images.async_add_listener(self._async_content_changed),
+        ]
+        self.notifier.async_start()
+        self.statistics.async_start()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop background work."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+        for unsub in self._unsub_content:
+            unsub()
+        self._unsub_content = []
+        self.verses.async_stop()
+        self.notifier.async_stop()
+        self.statistics.async_stop()
+
+    @callback
+    def async_archive(self, day: date | None = None) -> None:
+        """Archive the tracker, freezing the values of a day (today by default)."""
+        entry = self.hass.config_entries.async_get_entry(self.entry_id)
+        day = day or dt_util.now().date()
+        self.hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_ARCHIVED_ON: day.isoformat()}
+        )
+
+    @callback
+    def async_unarchive(self) -> None:
+        """Bring an archived tracker back, without archiving it automatically again."""
+        entry = self.hass.config_entries.async_get_entry(self.entry_id)
+        data = {**entry.data, CONF_ARCHIVE_AFTER_DAYS: 0}
+        data.pop(CONF_ARCHIVED_ON, None)
+        self.hass.config_entries.async_update_entry(entry, data=data)
+
+    @callback
+    def async_archive_if_due(self) -> bool:
+        """Archive the tracker once it is archive_after_days past the due date."""
+        if self.archived or not self.archive_after_days:
+            return False
+        archive_day = self.due_date + timedelta(days=self.archive_after_days)
+        if dt_util.now().date() < archive_day:
+            return False
+        self.async_archive(archive_day)
+        return True
+
+    def time_remaining(self) -> timedelta | None:
+        """Return the time left until the due time while the countdown shows it."""
+        if self.archived or not self.has_due_time:
+            return None
+        remaining = self.due_at - dt_util.now()
+        if get_refresh_cadence(remaining) is None:
+            return None
+        return remaining
+
+    @callback
+    def _async_schedule_refresh(self) -> None:
+        """Schedule the next refresh at the next time any value changes."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+        now = dt_util.now()
+        next_refresh = dt_util.start_of_local_day(now.date() + timedelta(days=1))
+        if self.has_due_time:
+            next_refresh = get_next_refresh(now, self.due_at, next_refresh)
+        self._unsub_refresh = async_track_point_in_time(
+            self.hass, self._async_refresh, next_refresh
+        )
+
+    async def _async_refresh(self, now: datetime) -> None:
+        """Update the entities whose values changed and schedule the next refresh."""
+        self._unsub_refresh = None
+        if self._refreshed_on == self.today:
+            listeners = self._tick_listeners
+        else:
+            # A new day; archive the tracker if it is due, which reloads it
+            if self.async_archive_if_due():
+                return
+            self._refreshed_on = self.today
+            await self.verses.async_ensure_day(self.calculate_values()["days_elapsed"])
+            listeners = self._listeners
+        for update_callback in list(listeners):
+            update_callback()
+        self._async_schedule_refresh()
+
+    async def async_update_config(self, entry: ConfigEntry) -> None:
+        """Apply changed config entry data to the live entities."""
+        previous = (self.due_date_str, self.pregnancy_length)
+        self._set_config(entry.data)
+        # A lower archive_after_days or an earlier due date can make the
+        # tracker due for archiving now; archiving reloads the entry
+        if self.async_archive_if_due():
+            return
+        if (self.due_date_str, self.pregnancy_length) != previous:
+            self.statistics.async_reset()
+
+        custom_path = entry.data.get(CONF_CUSTOM_BIBLE_VERSES, "")
+        translation = entry.data.get(CONF_BIBLE_TRANSLATION, "")
+        if (custom_path, translation) != (self.verses.custom_path, self.verses.translation):
+            await self.verses.async_reconfigure(custom_path, translation)
+        self.notifier.async_reconfigure(*_notify_options(entry.data))
+        # A new due date or length can move today to another content day
+        await self.verses.async_ensure_day(self.calculate_values()["days_elapsed"])
+        self.revision += 1
+        self._async_schedule_refresh()
+
+        device_registry = dr.async_get(self.hass)
+        if device := device_registry.async_get_device(identifiers={(DOMAIN, self.entry_id)}):
+            device_registry.async_update_device(device.id, name=self.device_name)
+
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def _async_content_changed(self) -> None:
+        """Record that the verses or images changed."""
+        self.revision += 1
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for configuration changes and day changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_tick_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for countdown ticks near the due time."""
+        self._tick_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._tick_listeners.remove(update_callback)
+
+        return remove_listener
+
+    def calculate_values(self) -> dict[str, Any]:
+        """Return all pregnancy values for today.
+
+        The values only change once a day, so they are calculated once per
+        day and shared by every sensor of the entry. Callers must not modify
+        the returned dict. Days start at midnight in Home Assistant's time
+        zone. Archived trackers always return the values of their archive
+        day.
+        """
+        today = self.today
+        if today != self._values_date:
+            self._values = calculate_values(
+                self.start_date, self.due_date, self.pregnancy_length, today
+            )
+            self._values_date = today
+        return self._values
@@ -0,0 +1,401 @@
+"""Indexed on-disk Bible verse library for Pregnancy Tracker.
+
+A verse library is a SQLite file holding verses for any number of
+translations, keyed by (translation, unit, position) where unit is
+"week" or "day". It can also hold per-day summaries and tips. Only the
+rows for the configured translation are ever read, and daily rows are
+read one day at a time, so memory use and startup time do not grow with
+the library size.
+
+Existing custom verse JSON files can be converted with::
+
+    python -m custom_components.pregnancy_tracker.verse_store \
+        my_verses.json /config/pregnancy_verses.db --translation NIV
+
+Daily content is imported the same way with ``--daily``.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sqlite3
+import sys
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
+from .comparisons import (
+    BIBLE_VERSES,
+    DEFAULT_VERSE_TABLE,
+    BibleVerse,
+    VerseFileError,
+    VerseTable,
+    format_week_ranges,
+    make_bible_verse,
+    preview_bible_verses,
+    read_custom_bible_verses,
+    read_json_object,
+    resolve_custom_path,
+    validate_bible_verses,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# File suffixes recognized as verse libraries instead of JSON files
+VERSE_LIBRARY_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+# Translation name used when none is given on import
+DEFAULT_TRANSLATION = "default"
+
+UNIT_WEEK = "week"
+UNIT_DAY = "day"
+
+# Daily content is addressed by days elapsed, 0 through this day
+MAX_CONTENT_DAY = 300
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verses (
+    translation TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    reference TEXT NOT NULL,
+    PRIMARY KEY (translation, unit, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS daily_content (
+    translation TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    summary TEXT NOT NULL,
+    tip TEXT NOT NULL,
+    PRIMARY KEY (translation, day)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True)
+class DailyContent:
+    """Content for a single day of pregnancy; empty fields are unset."""
+
+    day: int
+    summary: str
+    tip: str
+    verse: BibleVerse | None
+
+
+def is_verse_library(file_path: str) -> bool:
+    """Return True if a custom verses path points to a verse library."""
+    return Path(file_path).suffix.lower() in VERSE_LIBRARY_SUFFIXES
+
+
+class VerseStore:
+    """Read-only access to a verse library.
+
+    Every lookup is a primary key seek, so reading one translation's
+    verses costs the same whether the library holds one translation or
+    dozens.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open the library read-only."""
+        self._conn = sqlite3.connect(
+            f"{path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+
+    def close(self) -> None:
+        """Close the library."""
+        self._conn.close()
+
+    def translations(self) -> list[str]:
+        """Return the translations in the library."""
+        rows = self._conn.execute("SELECT DISTINCT translation FROM verses ORDER BY translation")
+        return [row[0] for row in rows]
+
+    def resolve_translation(self, translation: str) -> str:
+        """Pick the translation to use when none was configured.
+
+        A library with a single translation needs no configuration.
+        """
+        if translation:
+            return translation
+        translations = self.translations()
+        return translations[0] if len(translations) == 1 else DEFAULT_TRANSLATION
+
+    def weekly(self, translation: str) -> dict[int, tuple[str, str]]:
+        """Return the weekly (text, reference) rows of one translation."""
+        rows = self._conn.execute(
+            "SELECT position, text, reference FROM verses WHERE translation = ? AND unit = ?",
+            (translation, UNIT_WEEK),
+        )
+        return {position: (text, reference) for position, text, reference in rows}
+
+    def has_daily(self, translation: str) -> bool:
+        """Return True if the translation has any per-day content."""
+        if self._conn.execute(
+            "SELECT 1 FROM verses WHERE translation = ? AND unit = ? LIMIT 1",
+            (translation, UNIT_DAY),
+        ).fetchone():
+            return True
+        # Libraries created before daily content was supported lack the table
+        if not self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'daily_content'"
+        ).fetchone():
+            return False
+        return self._conn.execute(
+            "SELECT 1 FROM daily_content WHERE translation = ? LIMIT 1", (translation,)
+        ).fetchone() is not None
+
+    def daily(self, translation: str, day: int) -> DailyContent:
+        """Return the content of one day (two primary key seeks)."""
+        verse = self._conn.execute(
+            "SELECT text, reference FROM verses WHERE translation = ? AND unit = ? AND position = ?",
+            (translation, UNIT_DAY, day),
+        ).fetchone()
+        content = self._conn.execute(
+            "SELECT summary, tip FROM daily_content WHERE translation = ? AND day = ?",
+            (translation, day),
+        ).fetchone()
+        summary, tip = content or ("", "")
+        return DailyContent(
+            day=day,
+            summary=summary,
+            tip=tip,
+            verse=make_bible_verse(*verse) if verse else None,
+        )
+
+
+def open_verse_store(file_path: str) -> VerseStore:
+    """Open a verse library.
+
+    Raises:
+        VerseFileError: The library is missing or not a valid verse library.
+    """
+    path = resolve_custom_path(file_path)
+    if path is None:
+        raise VerseFileError(
+            "verses_not_found", f"Custom Bible verses file not found: {file_path}"
+        )
+    try:
+        store = VerseStore(path)
+        store.translations()
+    except sqlite3.Error as err:
+        raise VerseFileError(
+            "verses_invalid_format",
+            f"Custom Bible verses file {file_path} is not a verse library: {err}",
+        ) from err
+    return store
+
+
+def load_library_verses(file_path: str, translation: str = "") -> VerseTable:
+    """Load one translation's weekly verses over the defaults.
+
+    A library that cannot be opened is returned as the table's failure.
+    This reads from disk and must be run in the executor.
+    """
+    try:
+        with closing(open_verse_store(file_path)) as store:
+            translation = store.resolve_translation(translation)
+            weekly = store.weekly(translation)
+    except VerseFileError as err:
+        return VerseTable(
+            {week: DEFAULT_VERSE_TABLE.get(week) for week in BIBLE_VERSES},
+            custom=True,
+            failure=err,
+        )
+
+    verses = {week: DEFAULT_VERSE_TABLE.get(week) for week in BIBLE_VERSES}
+    verses.update(
+        {
+            week: make_bible_verse(text, reference)
+            for week, (text, reference) in weekly.items()
+            if 1 <= week <= 42
+        }
+    )
+    _LOGGER.debug(
+        "Loaded %d weekly verses for translation %s from %s",
+        len(weekly),
+        translation,
+        file_path,
+    )
+    return VerseTable(verses, custom=True)
+
+
+def load_daily_content(file_path: str, translation: str, day: int) -> DailyContent | None:
+    """Load the content of one day, or None if the library has no daily content.
+
+    Days are clamped to 0-MAX_CONTENT_DAY. This reads from disk and must be
+    run in the executor.
+    """
+    day = max(0, min(MAX_CONTENT_DAY, day))
+    try:
+        with closing(open_verse_store(file_path)) as store:
+            translation = store.resolve_translation(translation)
+            if not store.has_daily(translation):
+                return None
+            return store.daily(translation, day)
+    except (VerseFileError, sqlite3.Error) as err:
+        _LOGGER.error("Failed to load daily content for day %d: %s", day, err)
+        return None
+
+
+def preview_library_verses(file_path: str, translation: str = "") -> dict[str, str]:
+    """Summarize one translation of a verse library for a preview.
+
+    This reads from disk and must be run in the executor.
+
+    Raises:
+        VerseFileError: The library cannot be used for this translation.
+    """
+    with closing(open_verse_store(file_path)) as store:
+        translation = store.resolve_translation(translation)
+        weekly = store.weekly(translation)
+
+    weeks = sorted(week for week in weekly if 1 <= week <= 42)
+    if not weeks:
+        raise VerseFileError(
+            "verses_no_valid_entries",
+            f"Verse library {file_path} has no weekly verses for translation {translation}",
+        )
+
+    text, reference = weekly[weeks[0]]
+    sample_text = f"Week {weeks[0]}: {text}"
+    if reference:
+        sample_text += f" ({reference})"
+
+    return {
+        "verse_count": str(len(weeks)),
+        "weeks": format_week_ranges(weeks),
+        "sample": sample_text,
+        "problem_count": str(len(weekly) - len(weeks)),
+    }
+
+
+def preview_verses(file_path: str, translation: str = "") -> dict[str, str]:
+    """Validate a custom verses JSON file or verse library and summarize it.
+
+    This reads from disk and must be run in the executor.
+
+    Raises:
+        VerseFileError: The file cannot be used.
+    """
+    if is_verse_library(file_path):
+        return preview_library_verses(file_path, translation)
+    return preview_bible_verses(file_path)
+
+
+def import_bible_verses(json_path: str, db_path: str, translation: str) -> tuple[int, list[str]]:
+    """Import a custom verse JSON file into a verse library.
+
+    The library is created if needed. Rows already stored for the same
+    translation and week are replaced.
+
+    Returns:
+        The number of imported verses and the validation problems found.
+    """
+    verses, errors = validate_bible_verses(read_custom_bible_verses(json_path))
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        conn.executescript(_SCHEMA)
+        conn.executemany(
+            "INSERT OR REPLACE INTO verses VALUES (?, ?, ?, ?, ?)",
+            [
+                (translation, UNIT_WEEK, week, verse.text, verse.reference)
+                for week, verse in verses.items()
+            ],
+        )
+    return len(verses), errors
+
+
+def validate_daily_content(data: dict) -> tuple[list[tuple[int, str, str, str, str]], list[str]]:
+    """Validate daily content keyed by day.
+
+    Each day maps to an object with optional "summary", "tip", "text" and
+    "reference" strings.
+
+    Returns:
+        (day, summary, tip, text, reference) rows and a list of problems.
+    """
+    rows: list[tuple[int, str, str, str, str]] = []
+    errors: list[str] = []
+
+    for key, value in data.items():
+        try:
+            day = int(key)
+        except (TypeError, ValueError):
+            errors.append(f"Day key '{key}' is not a number")
+            continue
+        if day < 0 or day > MAX_CONTENT_DAY:
+            errors.append(f"Day {day} is outside the supported range 0-{MAX_CONTENT_DAY}")
+            continue
+        if not isinstance(value, dict):
+            errors.append(f"Day {day} must be an object")
+            continue
+
+        fields = [value.get(field, "") for field in ("summary", "tip", "text", "reference")]
+        if not all(isinstance(field, str) for field in fields):
+            errors.append(f"Day {day} has a non-text field")
+            continue
+        rows.append((day, *fields))
+
+    return rows, errors
+
+
+def import_daily_content(json_path: str, db_path: str, translation: str) -> tuple[int, list[str]]:
+    """Import a daily content JSON file into a verse library.
+
+    Rows already stored for the same translation and day are replaced.
+
+    Returns:
+        The number of imported days and the validation problems found.
+    """
+    rows, errors = validate_daily_content(read_json_object(json_path, "daily content"))
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        conn.executescript(_SCHEMA)
+        conn.executemany(
+            "INSERT OR REPLACE INTO daily_content VALUES (?, ?, ?, ?)",
+            [(translation, day, summary, tip) for day, summary, tip, _, _ in rows],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO verses VALUES (?, ?, ?, ?, ?)",
+            [
+                (translation, UNIT_DAY, day, text, reference)
+                for day, _, _, text, reference in rows
+                if text
+            ],
+        )
+    return len(rows), errors
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Convert custom verse JSON files into a verse library."""
+    parser = argparse.ArgumentParser(
+        description="Import a custom Bible verses JSON file into a verse library."
+    )
+    parser.add_argument("source", help="custom Bible verses (or daily content) JSON file")
+    parser.add_argument("library", help="verse library to create or update (.db)")
+    parser.add_argument(
+        "--translation",
+        default=DEFAULT_TRANSLATION,
+        help=f"translation name to store the verses under (default: {DEFAULT_TRANSLATION})",
+    )
+    parser.add_argument(
+        "--daily",
+        action="store_true",
+        help="import per-day content keyed by days elapsed instead of weekly verses",
+    )
+    args = parser.parse_args(argv)
+
+    importer = import_daily_content if args.daily else import_bible_verses
+    try:
+        count, errors = importer(args.source, args.library, args.translation)
+    except VerseFileError as err:
+        sys.stderr.write(f"{err}\n")
+        return 1
+
+    for error in errors:
+        sys.stderr.write(f"Skipped: {error}\n")
+    kind = "days" if args.daily else "verses"
+    sys.stdout.write(f"Imported {count} {kind} into {args.library} ({args.translation})\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,328 @@
+"""Live reloading of custom Bible verse files for Pregnancy Tracker."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_track_time_interval
+
+from .comparisons import (
+    DEFAULT_VERSE_TABLE,
+    BibleVerse,
+    VerseTable,
+    get_weekly_summary,
+    load_bible_verses,
+    resolve_custom_path,
+)
+from .const import DOMAIN
+from .verse_store import DailyContent, is_verse_library, load_daily_content, load_library_verses
+
+_LOGGER = logging.getLogger(__name__)
+
+# How often the custom verses file is checked for changes
+WATCH_INTERVAL = timedelta(minutes=1)
+
+# (inode, size, modification time) of a file
+FileSignature = tuple[int, int, int]
+
+
+def _file_signature(file_path: str) -> FileSignature | None:
+    """Return a cheap change signature for a file, or None if it is missing."""
+    path = resolve_custom_path(file_path)
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+# (custom path, translation, file signature) of a loaded verse table
+TableKey = tuple[str, str, FileSignature | None]
+
+# Called with the new signature when a watched file changes
+FileChangedCallback = Callable[[FileSignature | None], Awaitable[None]]
+
+
+def _load_table(custom_path: str, translation: str) -> VerseTable:
+    """Load the verse table from a JSON file or a verse library."""
+    if is_verse_library(custom_path):
+        return load_library_verses(custom_path, translation)
+    return load_bible_verses(custom_path)
+
+
+class VerseTables:
+    """Verse tables shared by all entries that use the same file.
+
+    Tables are keyed by path, translation and file signature, so entries
+    using the same file (and trackers imported in bulk usually do) load it
+    once and share one table. Each key is reference counted and dropped
+    when the last entry using it lets go, so memory grows with the number
+    of distinct files, not the number of trackers.
+
+    Files are watched the same way: one timer per path stats the file and
+    tells every subscribed entry when it changed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._tables: dict[TableKey, asyncio.Future[VerseTable]] = {}
+        self._refs: dict[TableKey, int] = {}
+        self._watchers: dict[str, list[FileChangedCallback]] = {}
+        self._signatures: dict[str, FileSignature | None] = {}
+        self._unsub_watch: dict[str, CALLBACK_TYPE] = {}
+
+    async def async_acquire(self, key: TableKey) -> VerseTable:
+        """Return the table of a key, loading it if no entry holds it yet."""
+        if (future := self._tables.get(key)) is None:
+            future = self._tables[key] = self.hass.async_add_executor_job(
+                _load_table, key[0], key[1]
+            )
+        self._refs[key] = self._refs.get(key, 0) + 1
+        try:
+            return await future
+        except BaseException:
+            self.async_release(key)
+            raise
+
+    @callback
+    def async_release(self, key: TableKey) -> None:
+        """Let go of the table of a key."""
+        self._refs[key] -= 1
+        if not self._refs[key]:
+            del self._refs[key]
+            del self._tables[key]
+
+    @callback
+    def async_watch(
+        self, path: str, signature: FileSignature | None, changed: FileChangedCallback
+    ) -> CALLBACK_TYPE:
+        """Call changed with the new signature whenever a file changes.
+
+        The file is stat'ed once per interval however many entries watch it;
+        signature is what the caller last loaded.
+        """
+        if (watchers := self._watchers.get(path)) is None:
+            watchers = self._watchers[path] = []
+            self._signatures[path] = signature
+
+            async def async_check_file(now: datetime) -> None:
+                await self._async_check_file(path)
+
+            self._unsub_watch[path] = async_track_time_interval(
+                self.hass, async_check_file, WATCH_INTERVAL
+            )
+        watchers.append(changed)
+
+        @callback
+        def remove_watch() -> None:
+            watchers.remove(changed)
+            if not watchers and self._watchers.get(path) is watchers:
+                del self._watchers[path]
+                del self._signatures[path]
+                self._unsub_watch.pop(path)()
+
+        return remove_watch
+
+    async def _async_check_file(self, path: str) -> None:
+        """Tell the watchers of a file if it changed since the last check."""
+        signature = await self.hass.async_add_executor_job(_file_signature, path)
+        if path not in self._watchers or signature == self._signatures[path]:
+            return
+        self._signatures[path] = signature
+        for changed in list(self._watchers[path]):
+            # Skip entries that stopped watching while an earlier one reloaded
+            if changed in self._watchers.get(path, ()):
+                await changed(signature)
+
+
+class VerseSource:
+    """Hold the verse table for an entry and keep it in sync with its file.
+
+    The custom file is watched through VerseTables, which stats it in the
+    executor at a low cadence, once for all entries using it; it is only
+    re-read when its signature changes. The freshly validated table replaces
+    the old one in a single assignment, so readers always see a complete
+    table, and only the registered listeners (the verse sensors) are told.
+
+    Tables are shared with other entries using the same file through
+    VerseTables.
+
+    Verse libraries may also hold per-day content. Only the current day's
+    row is kept in memory and it is fetched once per day change.
+
+    A file that cannot be used is logged once and raised as a Repairs
+    issue; nothing more is reported until the file or the configured path
+    changes, and the issue is removed once the file loads again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        tables: VerseTables,
+        entry_id: str,
+        custom_path: str,
+        translation: str = "",
+    ) -> None:
+        """Initialize the source."""
+        self.hass = hass
+        self._tables = tables
+        self._key: TableKey | None = None
+        self.issue_id = f"custom_verses_{entry_id}"
+        self._entry_id = entry_id
+        self.custom_path = custom_path
+        self.translation = translation
+        self.table: VerseTable = DEFAULT_VERSE_TABLE
+        self.daily: DailyContent | None = None
+        self._day: int | None = None
+        self._signature: FileSignature | None = None
+        self._listeners: list[Callable[[], None]] = []
+        self._unsub_watch: CALLBACK_TYPE | None = None
+        # (path, file signature, failure reason) of the last reported failure
+        self._reported: tuple[str, FileSignature | None, str] | None = None
+
+    async def async_load(self, watch: bool = True) -> None:
+        """Load the verse table and start watching the custom file."""
+        if not self.custom_path:
+            self._async_report_failure()
+            return
+        self._signature = await self.hass.async_add_executor_job(
+            _file_signature, self.custom_path
+        )
+        await self._async_use_table()
+        self._async_report_failure()
+        if watch:
+            self._unsub_watch = self._tables.async_watch(
+                self.custom_path, self._signature, self._async_file_changed
+            )
+
+    async def _async_use_table(self) -> None:
+        """Switch to the shared table of the current file."""
+        key = (self.custom_path, self.translation, self._signature)
+        table = await self._tables.async_acquire(key)
+        self._async_release_table()
+        self._key = key
+        self.table = table
+
+    @callback
+    def _async_release_table(self) -> None:
+        """Let go of the shared table in use, if any."""
+        if self._key is not None:
+            self._tables.async_release(self._key)
+            self._key = None
+
+    @callback
+    def _async_report_failure(self) -> None:
+        """Report an unusable custom file once, or clear a fixed one."""
+        failure = self.table.failure
+        if failure is None:
+            if self._reported is not None:
+                _LOGGER.info("Custom Bible verses from %s are in use again", self.custom_path)
+                self._reported = None
+            ir.async_delete_issue(self.hass, DOMAIN, self.issue_id)
+            return
+
+        state = (self.custom_path, self._signature, failure.reason)
+        if state == self._reported:
+            return
+        self._reported = state
+
+        not_found = failure.reason == "verses_not_found"
+        _LOGGER.log(
+            logging.WARNING if not_found else logging.ERROR,
+            "%s; using the default verses until it is fixed",
+            failure,
+        )
+        ir.async_create_issue(
+            self.hass,
+            DOMAIN,
+            self.issue_id,
+            is_fixable=True,
+            severity=ir.IssueSeverity.WARNING if not_found else ir.IssueSeverity.ERROR,
+            translation_key="custom_verses_unusable",
+            translation_placeholders={"path": self.custom_path, "error": str(failure)},
+            data={"entry_id": self._entry_id, "path": self.custom_path, "error": str(failure)},
+        )
+
+    def verse(self, week: int) -> BibleVerse:
+        """Return today's verse, preferring daily content over the weekly table."""
+        if self.daily is not None and self.daily.verse is not None:
+            return self.daily.verse
+        return self.table.get(week)
+
+    def summary(self, week: int) -> str:
+        """Return today's summary, preferring daily content over the weekly summary."""
+        if self.daily is not None and self.daily.summary:
+            return self.daily.summary
+        return get_weekly_summary(week)
+
+    async def async_ensure_day(self, day: int) -> None:
+        """Make sure the daily content for a day is loaded."""
+        if not is_verse_library(self.custom_path) or self.table.failure is not None:
+            # Content of a library that can no longer be used is dropped,
+            # so the weekly table or the default verses are shown instead
+            self._day = None
+            self.daily = None
+            return
+        if day == self._day:
+            return
+        self._day = day
+        self.daily = await self.hass.async_add_executor_job(
+            load_daily_content, self.custom_path, self.translation, day
+        )
+
+    async def async_reconfigure(self, custom_path: str, translation: str) -> None:
+        """Switch to another custom file or translation and notify listeners."""
+        self.async_stop()
+        self.custom_path = custom_path
+        self.translation = translation
+        self.table = DEFAULT_VERSE_TABLE
+        self.daily = None
+        day, self._day = self._day, None
+        await self.async_load()
+        if day is not None:
+            await self.async_ensure_day(day)
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop watching the custom file and let go of its table."""
+        if self._unsub_watch is not None:
+            self._unsub_watch()
+            self._unsub_watch = None
+        self._async_release_table()
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for verse table changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    async def _async_file_changed(self, signature: FileSignature | None) -> None:
+        """Reload the verse table if the custom file changed."""
+        if signature == self._signature:
+            return
+
+        _LOGGER.debug("Custom Bible verses file %s changed, reloading", self.custom_path)
+        self._signature = signature
+        await self._async_use_table()
+        self._async_report_failure()
+        if self._day is not None:
+            day, self._day = self._day, None
+            self.daily = None
+            await self.async_ensure_day(day)
+        for update_callback in list(self._listeners):
+            update_callback()
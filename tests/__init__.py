@@ -0,0 +1 @@
+"""Tests for the Pregnancy Tracker integration."""
@@ -0,0 +1,101 @@
+"""Memory footprint of the trackers and their sensors at 1,000 entries.
+
+Measured with tracemalloc on Python 3.13 for the sensor objects of 1,000
+config entries, trackers excluded:
+
+* before, one subclass per sensor, each storing its own copy of the config
+  entry, due date, start date and length: 327 bytes per sensor, 4,904
+  bytes per tracker (15 sensors)
+* after, one class driven by entity descriptions that reads the shared
+  per-entry tracker: 298 bytes per sensor, 5,069 bytes per tracker
+  (17 sensors)
+
+With the sensors added since, a tracker and its 22 sensors take about
+7,900 bytes, 285 bytes per sensor.
+
+The budgets below leave room for other Python versions while failing if
+per-entity state creeps back into the sensors.
+"""
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.pregnancy_tracker import sensor
+from custom_components.pregnancy_tracker.const import DOMAIN
+from custom_components.pregnancy_tracker.images import ComparisonImages
+from custom_components.pregnancy_tracker.tracker import PregnancyTracker
+from custom_components.pregnancy_tracker.verse_watcher import VerseTables
+
+TRACKER_COUNT = 1000
+
+# Bytes allocated per sensor entity
+SENSOR_BUDGET = 360
+
+# Bytes allocated per tracker, including all of its sensors
+TRACKER_BUDGET = 10_000
+
+
+def _allocated(start: tracemalloc.Snapshot, end: tracemalloc.Snapshot) -> int:
+    """Return the bytes allocated between two snapshots."""
+    return sum(stat.size_diff for stat in end.compare_to(start, "filename"))
+
+
+async def _async_create_sensors(
+    hass: HomeAssistant, tracker: PregnancyTracker, entry: MockConfigEntry
+) -> list[sensor.PregnancyTrackerSensor]:
+    """Create the sensors of a tracker the way the platform does."""
+    entities: list[sensor.PregnancyTrackerSensor] = []
+    hass.data[DOMAIN][entry.entry_id] = tracker
+    await sensor.async_setup_entry(hass, entry, entities.extend)
+    return entities
+
+
+async def test_memory_per_tracker(hass: HomeAssistant) -> None:
+    """Test the memory used per tracker and per sensor at 1,000 entries."""
+    hass.data[DOMAIN] = {}
+    images = ComparisonImages(hass)
+    verse_tables = VerseTables(hass)
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={"due_date": f"2027-{1 + index % 12:02d}-{1 + index % 28:02d}"},
+        )
+        for index in range(TRACKER_COUNT)
+    ]
+    # Warm up module level caches so they are not counted
+    await _async_create_sensors(
+        hass, PregnancyTracker(hass, entries[0], images, verse_tables), entries[0]
+    )
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.take_snapshot()
+        trackers = [PregnancyTracker(hass, entry, images, verse_tables) for entry in entries]
+        gc.collect()
+        created_trackers = tracemalloc.take_snapshot()
+        sensors = [
+            await _async_create_sensors(hass, tracker, entry)
+            for tracker, entry in zip(trackers, entries)
+        ]
+        gc.collect()
+        created_sensors = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    sensor_count = len(sensor.SENSOR_DESCRIPTIONS)
+    tracker_bytes = _allocated(start, created_trackers) / TRACKER_COUNT
+    sensor_bytes = _allocated(created_trackers, created_sensors) / (TRACKER_COUNT * sensor_count)
+    per_tracker = tracker_bytes + sensor_bytes * sensor_count
+    assert sensor_bytes <= SENSOR_BUDGET, f"{sensor_bytes:.0f} bytes per sensor"
+    assert per_tracker <= TRACKER_BUDGET, f"{per_tracker:.0f} bytes per tracker"
+
+    # Sensors share their entry's tracker and device info instead of copies
+    for tracker, entities in zip(trackers, sensors):
+        assert len(entities) == sensor_count
+        assert all(entity._tracker is tracker for entity in entities)
+        assert len({id(entity.device_info) for entity in entities}) == 1
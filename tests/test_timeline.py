@@ -0,0 +1,233 @@
+"""Day-by-day golden snapshots of every sensor, with per-tick budgets.
+
+Time is frozen and walked one local day at a time from the start of the
+pregnancy to 21 days past the due date, for short, average and long
+pregnancies. The first day records every sensor's state and attributes;
+each later day records the states and attributes that changed, so the
+snapshots in __snapshots__/test_timeline.ambr cover every value of every
+day. Update them with ``pytest --snapshot-update`` after intended changes.
+The comparison image URLs in them point into the atlas, so they are only
+reproduced with the Pillow version pinned in requirements_test.txt.
+
+Every tick must also stay within a CPU-time and state-write budget, so
+performance regressions fail the build.
+"""
+from __future__ import annotations
+
+import gc
+import time
+from datetime import date, datetime, timedelta
+from typing import Any
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from syrupy.assertion import SnapshotAssertion
+
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.pregnancy_tracker.const import DOMAIN
+from custom_components.pregnancy_tracker.sensor import SENSOR_DESCRIPTIONS
+
+DUE_DATE = date(2027, 3, 1)
+
+# Days recorded after the due date
+DAYS_AFTER_DUE = 21
+
+# CPU time one tick may take on the event loop thread, in seconds
+TICK_CPU_BUDGET = 0.05
+
+# States one midnight tick may write: each sensor at most once
+MIDNIGHT_WRITE_BUDGET = len(SENSOR_DESCRIPTIONS)
+
+
+class TickRecorder:
+    """Count the state writes of a tracker's entities and time each tick."""
+
+    def __init__(self, hass: HomeAssistant, entity_ids: set[str]) -> None:
+        """Listen for state writes of the entities."""
+        self.hass = hass
+        self.entity_ids = entity_ids
+        self.writes = 0
+
+        @callback
+        def is_tracked(event_data: dict[str, Any]) -> bool:
+            return event_data["entity_id"] in self.entity_ids
+
+        @callback
+        def count_write(event: Event) -> None:
+            self.writes += 1
+
+        for event_type in (EVENT_STATE_CHANGED, EVENT_STATE_REPORTED):
+            hass.bus.async_listen(event_type, count_write, event_filter=is_tracked)
+
+    async def async_tick(self, freezer: FrozenDateTimeFactory, now: datetime) -> tuple[float, int]:
+        """Move to a time, run what is due then and return its CPU time and writes."""
+        await self.hass.async_block_till_done()
+        self.writes = 0
+        freezer.move_to(now)
+        # Garbage collection pauses and executor jobs are not the tick's cost
+        gc.disable()
+        try:
+            started = time.thread_time()
+            async_fire_time_changed(self.hass, now)
+            await self.hass.async_block_till_done()
+            cpu_time = time.thread_time() - started
+        finally:
+            gc.enable()
+        return cpu_time, self.writes
+
+
+async def _async_setup_tracker(
+    hass: HomeAssistant, tmp_path: Any, freezer: FrozenDateTimeFactory, now: datetime, **data: Any
+) -> tuple[MockConfigEntry, dict[str, str]]:
+    """Set up a tracker at a time and return it with its entity ids by sensor key."""
+    # Keep the copied comparison images out of the shared test config
+    hass.config.config_dir = str(tmp_path)
+    freezer.move_to(now)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"due_date": DUE_DATE.isoformat(), "custom_bible_verses": "", **data},
+        unique_id=f"pregnancy_{DUE_DATE.isoformat()}",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_registry = er.async_get(hass)
+    entity_ids = {
+        registry_entry.unique_id.removeprefix(f"{entry.entry_id}_"): registry_entry.entity_id
+        for registry_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+    }
+    assert len(entity_ids) == len(SENSOR_DESCRIPTIONS)
+    return entry, entity_ids
+
+
+def _states(hass: HomeAssistant, entity_ids: dict[str, str]) -> dict[str, dict[str, Any]]:
+    """Return the state and attributes of each sensor by key."""
+    states = {}
+    for key, entity_id in sorted(entity_ids.items()):
+        state = hass.states.get(entity_id)
+        states[key] = {"state": state.state, "attributes": dict(state.attributes)}
+    return states
+
+
+def _changes(
+    previous: dict[str, dict[str, Any]], states: dict[str, dict[str, Any]]
+) -> dict[str, dict[str, Any]]:
+    """Return the changed states and attributes of each sensor that changed."""
+    changes = {}
+    for key, value in states.items():
+        change: dict[str, Any] = {}
+        if value["state"] != previous[key]["state"]:
+            change["state"] = value["state"]
+        attributes = {
+            name: attribute
+            for name, attribute in value["attributes"].items()
+            if previous[key]["attributes"].get(name, change) != attribute
+        }
+        if removed := previous[key]["attributes"].keys() - value["attributes"].keys():
+            attributes.update(dict.fromkeys(sorted(removed), "<removed>"))
+        if attributes:
+            change["attributes"] = attributes
+        if change:
+            changes[key] = change
+    return changes
+
+
+@pytest.fixture(autouse=True)
+async def time_zone(hass: HomeAssistant) -> None:
+    """Run the timeline in a time zone with daylight saving time."""
+    await hass.config.async_set_time_zone("America/Los_Angeles")
+
+
+@pytest.mark.parametrize("pregnancy_length", [266, 280, 294])
+async def test_timeline(
+    hass: HomeAssistant,
+    tmp_path: Any,
+    freezer: FrozenDateTimeFactory,
+    snapshot: SnapshotAssertion,
+    pregnancy_length: int,
+) -> None:
+    """Test every sensor on every day against the golden snapshot."""
+    start_date = DUE_DATE - timedelta(days=pregnancy_length)
+    _, entity_ids = await _async_setup_tracker(
+        hass,
+        tmp_path,
+        freezer,
+        dt_util.start_of_local_day(start_date) + timedelta(seconds=1),
+        pregnancy_length=pregnancy_length,
+    )
+    recorder = TickRecorder(hass, set(entity_ids.values()))
+
+    previous = _states(hass, entity_ids)
+    timeline = {start_date.isoformat(): previous}
+    day = start_date + timedelta(days=1)
+    while day <= DUE_DATE + timedelta(days=DAYS_AFTER_DUE):
+        midnight = dt_util.start_of_local_day(day)
+
+        cpu_time, writes = await recorder.async_tick(freezer, midnight)
+        assert cpu_time <= TICK_CPU_BUDGET, f"midnight tick of {day} took {cpu_time:.3f}s"
+        assert writes <= MIDNIGHT_WRITE_BUDGET, f"midnight tick of {day} wrote {writes} states"
+
+        # Nothing changes during the day without a due time
+        cpu_time, writes = await recorder.async_tick(freezer, midnight + timedelta(hours=12))
+        assert cpu_time <= TICK_CPU_BUDGET, f"noon tick of {day} took {cpu_time:.3f}s"
+        assert writes == 0, f"noon tick of {day} wrote {writes} states"
+
+        states = _states(hass, entity_ids)
+        timeline[day.isoformat()] = _changes(previous, states)
+        previous = states
+        day += timedelta(days=1)
+
+    assert timeline == snapshot
+
+
+async def test_due_time_ticks_write_only_the_countdown(
+    hass: HomeAssistant, tmp_path: Any, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the hourly and minutely countdown ticks before a due time."""
+    due_at = dt_util.start_of_local_day(DUE_DATE) + timedelta(hours=12)
+    _, entity_ids = await _async_setup_tracker(
+        hass, tmp_path, freezer, due_at - timedelta(days=2), due_time="12:00:00"
+    )
+    recorder = TickRecorder(hass, {entity_ids["countdown"]})
+    others = TickRecorder(hass, set(entity_ids.values()) - {entity_ids["countdown"]})
+
+    # Hourly in the final week, then every minute on the final day
+    ticks = [due_at - timedelta(days=2) + timedelta(hours=hour) for hour in range(1, 24)]
+    ticks += [due_at - timedelta(days=1) + timedelta(minutes=minute) for minute in range(1, 61)]
+    for tick in ticks:
+        cpu_time, writes = await recorder.async_tick(freezer, tick)
+        assert cpu_time <= TICK_CPU_BUDGET, f"tick at {tick} took {cpu_time:.3f}s"
+        if tick.hour or tick.minute:
+            assert writes == 1, f"tick at {tick} wrote the countdown {writes} times"
+            assert others.writes == 0, f"tick at {tick} wrote {others.writes} other states"
+        others.writes = 0
+
+    assert hass.states.get(entity_ids["countdown"]).state == "23h 0m"
+
+
+async def test_day_follows_home_assistant_time_zone(
+    hass: HomeAssistant, tmp_path: Any, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the day rolls over at local midnight, not at the system's midnight."""
+    await hass.config.async_set_time_zone("Pacific/Auckland")
+    # 2026-06-02 01:00 in Auckland is still 2026-06-01 in UTC
+    local_now = datetime(2026, 6, 2, 1, 0, tzinfo=dt_util.get_default_time_zone())
+    _, entity_ids = await _async_setup_tracker(hass, tmp_path, freezer, local_now)
+    assert date.today() == date(2026, 6, 1)
+
+    expected = (DUE_DATE - date(2026, 6, 2)).days
+    assert hass.states.get(entity_ids["days_remaining"]).state == str(expected)
+
+    freezer.move_to(dt_util.start_of_local_day(date(2026, 6, 3)))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_ids["days_remaining"]).state == str(expected - 1)